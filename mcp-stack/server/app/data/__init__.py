@@ -1,9 +1,11 @@
 """
 Data package initialization.
-This ensures NLTK is installed and data is properly set up before any other imports.
+This points NLTK at the project's data directories before any other imports.
+Missing NLTK data is downloaded later by ensure_nltk_ready(), from the FastAPI
+startup hook or via ``python -m app.data.nltk_setup``.
 """
 
-# Import the NLTK setup module which will run automatically
+# Importing the NLTK setup module only configures the data search path
 from .nltk_setup import nltk_data_dir  # noqa: F401
 from .data_service import data_service  # noqa: F401
 
@@ -1,16 +1,28 @@
 """Data loading and querying functionality for MCP sample data."""
-import json
 import os
+import re
 import sys
+import time
+import heapq
+import operator
 import nltk
+import orjson
 import logging
+import numpy as np
+import pandas as pd
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from difflib import get_close_matches, SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Literal
-from pydantic import BaseModel, Field, field_validator
+from typing import Callable, Collection, Dict, FrozenSet, Iterator, List, Any, NamedTuple, Optional, Tuple, Literal
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from logging.handlers import RotatingFileHandler
 
+from app.data.search_index import TrigramIndex
+
 # Import ratio from difflib for string similarity
 def ratio(a, b):
     return SequenceMatcher(None, a, b).ratio()
@@ -72,9 +84,10 @@ try:
         nltk.data.find('tokenizers/punkt')
         logger.debug("Punkt tokenizer found")
     except LookupError:
-        logger.warning("Punkt tokenizer not found. Attempting to download...")
-        nltk.download('punkt')
-        logger.info("Successfully downloaded punkt tokenizer")
+        logger.warning(
+            "Punkt tokenizer not found. Run 'python -m app.data.nltk_setup' "
+            "or set AUTO_DOWNLOAD_NLTK to download it."
+        )
 
     # Now import NLTK-dependent modules
     from textblob import TextBlob
@@ -84,13 +97,51 @@ except ImportError as e:
     logger.error(f"Failed to initialize NLTK environment: {str(e)}")
     raise RuntimeError("Failed to set up NLTK environment. Please ensure all dependencies are installed.")
 
-# Initialize RAKE (Rapid Automatic Keyword Extraction)
-rake_nltk = Rake()
+# Call summaries repeat across transcripts, so tokenization results are
+# memoized. The cached layer returns tuples so callers cannot mutate them.
+@lru_cache(maxsize=4096)
+def _sent_tokenize_cached(text: str) -> Tuple[str, ...]:
+    return tuple(nltk.sent_tokenize(text))
+
+def _sent_tokenize(text: str) -> List[str]:
+    """Split text into sentences, memoized per text."""
+    return list(_sent_tokenize_cached(text))
+
+@lru_cache(maxsize=4096)
+def _word_tokenize_cached(text: str) -> Tuple[str, ...]:
+    return tuple(nltk.word_tokenize(text))
+
+def _word_tokenize(text: str) -> List[str]:
+    """Split text into words, memoized per text."""
+    return list(_word_tokenize_cached(text))
+
+# RAKE (Rapid Automatic Keyword Extraction) and the stopword set both load the
+# stopwords corpus, so they are built on first use rather than on import; that
+# way the app can start and download missing NLTK data in its startup hook.
+# RAKE keeps per-call state, hence the lock.
+_rake_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_rake() -> Rake:
+    """Return the shared RAKE instance, building it on first use."""
+    return Rake(sentence_tokenizer=_sent_tokenize)
+
+@lru_cache(maxsize=1)
+def _get_stopwords() -> FrozenSet[str]:
+    """Return the English stopwords as a set, loading the corpus on first use."""
+    return frozenset(nltk.corpus.stopwords.words('english'))
+
+@lru_cache(maxsize=1)
+def _get_sentiment_analyzer():
+    """Return the shared VADER analyzer, loading its lexicon on first use."""
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
 
 def analyze_sentiment(text: str) -> Dict[str, float]:
     """Analyze sentiment of the given text and return polarity and subjectivity.
 
     This function uses TextBlob for sentiment analysis, with VADER as a fallback.
+    Results are memoized per text; each call returns a fresh dictionary.
 
     Args:
         text: The text to analyze
@@ -98,12 +149,21 @@ def analyze_sentiment(text: str) -> Dict[str, float]:
     Returns:
         Dictionary with 'polarity' (from -1 to 1) and 'subjectivity' (0 to 1) scores
     """
-    logger.debug("Starting sentiment analysis", extra={"text_length": len(text)})
-
-    if not text.strip():
+    # Blank text is neutral; answer before hashing it into the cache
+    if not text or not text.strip():
         logger.warning("Empty text provided for sentiment analysis")
         return {"polarity": 0.0, "subjectivity": 0.0}
 
+    return dict(_analyze_sentiment_cached(text))
+
+@lru_cache(maxsize=2048)
+def _analyze_sentiment_cached(text: str) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(_analyze_sentiment(text).items())
+
+def _analyze_sentiment(text: str) -> Dict[str, float]:
+    """Uncached implementation of analyze_sentiment."""
+    logger.debug("Starting sentiment analysis", extra={"text_length": len(text)})
+
     try:
         # Ensure NLTK data is available
         try:
@@ -133,9 +193,7 @@ def analyze_sentiment(text: str) -> Dict[str, float]:
         if abs(polarity) < 0.1:  # If sentiment is very close to neutral
             logger.debug("TextBlob returned neutral sentiment, trying VADER as fallback")
             try:
-                from nltk.sentiment import SentimentIntensityAnalyzer
-                sia = SentimentIntensityAnalyzer()
-                vader_scores = sia.polarity_scores(text)
+                vader_scores = _get_sentiment_analyzer().polarity_scores(text)
 
                 logger.debug("VADER analysis results", extra={
                     "vader_scores": vader_scores,
@@ -271,9 +329,10 @@ def _find_best_match(phrase: str, threshold: float = 0.6) -> Optional[str]:
     logger.debug(f"No good match found for '{phrase}'. Best was '{best_match}' with similarity {highest_similarity:.2f}")
     return None
 
-def _get_generic_words():
+@lru_cache(maxsize=1)
+def _get_generic_words() -> FrozenSet[str]:
     """Return a set of generic words that shouldn't be used as standalone contexts."""
-    return {
+    return frozenset({
         'regarding', 'about', 'call', 'contact', 'regard', 'discuss', 'discussion',
         'issue', 'problem', 'matter', 'situation', 'thing', 'something', 'anything',
         'everything', 'nothing', 'someone', 'anyone', 'everyone', 'no one', 'need',
@@ -292,7 +351,17 @@ def _get_generic_words():
         'now', 'd', 'll', 'm', 'o', 're', 've', 'y', 'ain', 'aren', 'couldn', 'didn',
         'doesn', 'hadn', 'hasn', 'haven', 'isn', 'ma', 'mightn', 'mustn', 'needn',
         'shan', 'shouldn', 'wasn', 'weren', 'won', 'wouldn'
-    }
+    })
+
+# Lead-in phrases that make a candidate too generic, as a tuple so a single
+# str.startswith call checks them all
+_GENERIC_PHRASES: Tuple[str, ...] = (
+    'call regarding', 'regarding the', 'about the', 'call about', 'contact about',
+    'in regards to', 'with regard to', 'with respect to', 'as per', 'as per the',
+    'in reference to', 'with reference to', 'in relation to', 'in connection with',
+    'in terms of', 'in the matter of', 'on the subject of', 'on the topic of',
+    'with reference', 'with regards', 'in response to', 'in reply to', 're:', 'fw:'
+)
 
 def _is_too_generic(phrase: str) -> bool:
     """Check if a phrase is too generic to be useful as a context."""
@@ -314,17 +383,8 @@ def _is_too_generic(phrase: str) -> bool:
     if all(word in generic_words for word in words):
         return True
 
-    # Common phrases that are too generic
-    generic_phrases = {
-        'call regarding', 'regarding the', 'about the', 'call about', 'contact about',
-        'in regards to', 'with regard to', 'with respect to', 'as per', 'as per the',
-        'in reference to', 'with reference to', 'in relation to', 'in connection with',
-        'in terms of', 'in the matter of', 'on the subject of', 'on the topic of',
-        'with reference', 'with regards', 'in response to', 'in reply to', 're:', 'fw:'
-    }
-
     # Check if the phrase starts with any generic phrase
-    if any(phrase.lower().startswith(gp) for gp in generic_phrases):
+    if phrase.lower().startswith(_GENERIC_PHRASES):
         return True
 
     return False
@@ -332,6 +392,8 @@ def _is_too_generic(phrase: str) -> bool:
 def extract_contexts(text: str, top_n: int = 5, similarity_threshold: float = 0.6) -> List[str]:
     """Extract key contexts from text using RAKE algorithm and match with predefined contexts.
 
+    Results are memoized per arguments; each call returns a fresh list.
+
     Args:
         text: The text to analyze
         top_n: Maximum number of contexts to return (default: 5)
@@ -344,6 +406,14 @@ def extract_contexts(text: str, top_n: int = 5, similarity_threshold: float = 0.
         logger.debug("Empty text provided to extract_contexts")
         return []
 
+    return list(_extract_contexts_cached(text, top_n, similarity_threshold))
+
+@lru_cache(maxsize=2048)
+def _extract_contexts_cached(text: str, top_n: int, similarity_threshold: float) -> Tuple[str, ...]:
+    return tuple(_extract_contexts(text, top_n, similarity_threshold))
+
+def _extract_contexts(text: str, top_n: int, similarity_threshold: float) -> List[str]:
+    """Uncached implementation of extract_contexts."""
     logger.debug(f"Extracting contexts from text: '{text[:100]}...'")
 
     # Extract candidate phrases using RAKE or fallback methods
@@ -479,13 +549,11 @@ def _extract_with_rake(text: str, top_n: int) -> List[str]:
             from nltk_setup import setup_nltk
             setup_nltk()
 
-        # Initialize RAKE with custom stopwords
-        from rake_nltk import Rake
-        rake = Rake()
-
         # Extract keywords with scores
-        rake.extract_keywords_from_text(text)
-        keyword_scores = rake.get_ranked_phrases_with_scores()
+        rake = _get_rake()
+        with _rake_lock:
+            rake.extract_keywords_from_text(text)
+            keyword_scores = rake.get_ranked_phrases_with_scores()
 
         # Sort by score (descending) and get top N
         keyword_scores.sort(key=lambda x: x[0], reverse=True)
@@ -506,24 +574,12 @@ def _extract_with_nltk(text: str, top_n: int) -> List[str]:
     try:
         logger.debug("Falling back to NLTK word tokenizer...")
 
-        # Ensure NLTK data is available
         try:
-            from nltk.tokenize import word_tokenize
-            from nltk.corpus import stopwords
-
-            # Try to load stopwords
-            try:
-                stop_words = set(stopwords.words('english'))
-            except LookupError:
-                logger.info("Downloading NLTK stopwords...")
-                from nltk_setup import setup_nltk
-                setup_nltk()
-                stop_words = set(stopwords.words('english'))
-
             # Tokenize and filter words
+            stopwords = _get_stopwords()
             words = [
-                word.lower() for word in word_tokenize(text)
-                if word.isalnum() and word.lower() not in stop_words and len(word) > 3
+                word.lower() for word in _word_tokenize(text)
+                if word.isalnum() and word.lower() not in stopwords and len(word) > 3
             ]
 
             # Get unique words and return top N
@@ -573,6 +629,10 @@ class Customer(BaseModel):
     personal_info: Dict[str, Any]
     home_address: Dict[str, str]
     employment: Employment
+    # Lowercased name, email, company, city and state, used by full-text search,
+    # both separately (for prefix matches) and joined into one haystack
+    _search_fields: Tuple[str, ...] = PrivateAttr(default=())
+    _searchable: str = PrivateAttr(default='')
 
 class CallTranscript(BaseModel):
     """Call transcript data model with sentiment and context analysis."""
@@ -594,13 +654,27 @@ class CallTranscript(BaseModel):
         default_factory=list,
         description="List of key contexts extracted from the call summary"
     )
+    # GraphQL views of transcript/sentiment, built once by DataLoader
+    _gql_entries: Optional[List[Any]] = PrivateAttr(default=None)
+    _gql_sentiment: Optional[Any] = PrivateAttr(default=None)
+    # Lowercased summary and entry texts, used by transcript text search
+    _all_text_lower: Optional[str] = PrivateAttr(default=None)
+    _summary_lower: str = PrivateAttr(default='')
+    _entry_texts_lower: Tuple[str, ...] = PrivateAttr(default=())
+    # Lowercased contexts, for case-insensitive context filters
+    _contexts_lower: FrozenSet[str] = PrivateAttr(default=frozenset())
+    # call_timestamp as epoch seconds (0 if unparseable), for date filters and sorts
+    _call_ts_epoch: int = PrivateAttr(default=0)
 
     def __init__(self, **data):
         """Initialize the transcript and analyze the call summary."""
         super().__init__(**data)
+        self.analyze()
 
+    def analyze(self) -> None:
+        """Set sentiment and contexts from the call summary."""
         # Analyze the call summary if it exists
-        if hasattr(self, 'call_summary') and self.call_summary and self.call_summary.strip():
+        if self.call_summary and self.call_summary.strip():
             try:
                 # Analyze sentiment
                 self.sentiment = analyze_sentiment(self.call_summary)
@@ -620,12 +694,133 @@ class CallTranscript(BaseModel):
             self.sentiment = {"polarity": 0.0, "subjectivity": 0.0}
             self.contexts = []
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "CallTranscript":
+        """Build a transcript from our own data files without re-validating it.
+
+        Falls back to full validation when the record does not have the
+        expected shape.
+        """
+        if _TRANSCRIPT_REQUIRED_FIELDS.issubset(data) and isinstance(data['transcript'], list) \
+                and isinstance(data['call_summary'], str):
+            transcript = cls.model_construct(**data)
+            transcript.analyze()
+            return transcript
+        return cls(**data)
+
     @field_validator('call_summary', mode='before')
     @classmethod
     def analyze_call_summary(cls, v: str) -> str:
         """Analyze the call summary and set sentiment and contexts."""
         return v
 
+# Fields without defaults; records missing any of them get fully validated
+_TRANSCRIPT_REQUIRED_FIELDS = frozenset(
+    name for name, field in CallTranscript.model_fields.items() if field.is_required()
+)
+
+@lru_cache(maxsize=256)
+def _compile_needle(query: str) -> re.Pattern:
+    """Compile a lowercased literal search string, cached across searches."""
+    return re.compile(re.escape(query.lower()))
+
+@lru_cache(maxsize=256)
+def _compile_terms(needle: str) -> re.Pattern:
+    """Compile an alternation of a lowercased query's words, longest first."""
+    terms = sorted(set(needle.split()), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(term) for term in terms))
+
+# Worker count for parallel file reads; loading is I/O-bound
+_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# ijson is optional; with it, very large list-shaped transcript files are
+# streamed one record at a time instead of being parsed into memory at once
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_STREAM_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Number of full-text queries whose matching IDs are kept between searches
+_MATCH_CACHE_SIZE = 256
+
+# Data files are checked for changes at most this often
+_STALE_CHECK_INTERVAL_SECONDS = 5.0
+
+
+def _customer_search_fields(customer: Customer) -> Tuple[str, ...]:
+    """Return the lowercased fields a customer full-text query is matched against."""
+    personal_info = customer.personal_info or {}
+    home_address = customer.home_address or {}
+    return tuple(
+        (value or '').lower()
+        for value in (
+            personal_info.get('first_name'),
+            personal_info.get('last_name'),
+            personal_info.get('email'),
+            customer.employment.company,
+            home_address.get('city'),
+            home_address.get('state'),
+        )
+    )
+
+
+def _timestamp_epoch(timestamp: Optional[str]) -> int:
+    """Parse an ISO timestamp into epoch seconds, returning 0 if it is invalid."""
+    try:
+        return int(datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp())
+    except (AttributeError, ValueError):
+        return 0
+
+
+def _customer_relevance(customer: Customer, needle: str) -> int:
+    """Score a customer against a lowercased query; prefix matches count extra."""
+    relevance = customer._searchable.count(needle)
+    if any(field.startswith(needle) for field in customer._search_fields):
+        relevance += 2
+    return relevance
+
+
+def _transcript_relevance(transcript: CallTranscript, needle: str) -> int:
+    """Score a transcript against a lowercased query, weighting the summary highest.
+
+    Multi-word queries score every occurrence of any of their words, found in
+    a single regex scan per text.
+    """
+    relevance = 0
+    summary = transcript._summary_lower
+    if len(needle.split()) > 1:
+        terms = _compile_terms(needle)
+        relevance += sum(1 for _ in terms.finditer(summary)) * 2
+        relevance += sum(1 for text in transcript._entry_texts_lower if terms.search(text))
+    else:
+        relevance += summary.count(needle) * 2
+        relevance += sum(1 for text in transcript._entry_texts_lower if needle in text)
+    if summary.startswith(needle):
+        relevance += 5
+    return relevance
+
+
+def _top_k(items: List[Any], k: int, key: Callable[[Any], Any], reverse: bool) -> List[Any]:
+    """Return the first k of items in sorted order without sorting all of them.
+
+    Ties keep their original order, exactly as with sorted(items)[:k].
+    """
+    if k >= len(items):
+        return sorted(items, key=key, reverse=reverse)
+    if reverse:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+
+class SearchPage(NamedTuple):
+    """One page of search results along with the size of the full result set."""
+    items: List[Any]
+    total: int
+    aggregations: Optional[Dict[str, Any]] = None
+
+
 class DataLoader:
     """Load and query MCP sample data."""
 
@@ -634,98 +829,362 @@ class DataLoader:
         self.data_dir = Path(data_dir)
         self._customers = None
         self._transcripts = None
+        self._customers_loaded = False
+        self._transcripts_loaded = False
+        self._by_customer: Dict[str, List[CallTranscript]] = {}
+        # (transcript count, latest call timestamp) per customer
+        self._customer_transcript_stats: Dict[str, Tuple[int, Optional[str]]] = {}
+        self._last_contact_epoch: Dict[str, int] = {}
+        # Columnar copies of the filterable fields for vectorized searches
+        self._customers_df: Optional[pd.DataFrame] = None
+        self._transcripts_df: Optional[pd.DataFrame] = None
+        # Trigram indexes for full-text queries, plus their recent results
+        self._customer_index = TrigramIndex()
+        self._transcript_index = TrigramIndex()
+        self._match_cache: "OrderedDict[Tuple[str, str], FrozenSet[str]]" = OrderedDict()
+        # Fully ordered results of unfiltered searches, keyed by (kind, sort_by, sort_order)
+        self._unfiltered_results: Dict[Tuple[str, str, str], Any] = {}
+        self._lock = threading.RLock()
+        self._data_mtime: Optional[float] = None
+        self._next_stale_check = 0.0
+        # Bumped whenever the data is reloaded so dependent caches can tell
+        self.generation = 0
+
+    def _get_data_mtime(self) -> float:
+        """Return the most recent modification time across all data files."""
+        paths = [self.data_dir / "customers.json", self.data_dir / "transcripts"]
+        paths.extend((self.data_dir / "transcripts").glob("*.json"))
+
+        mtime = 0.0
+        for path in paths:
+            try:
+                mtime = max(mtime, os.stat(path).st_mtime)
+            except OSError:
+                continue
+        return mtime
+
+    @staticmethod
+    def _read_json_file(file_path: Path) -> Any:
+        """Read and parse a single JSON file, returning None if it is invalid.
+
+        Large top-level arrays are returned as a lazy record iterator when
+        ijson is installed.
+        """
+        try:
+            if ijson is not None and file_path.stat().st_size > _STREAM_THRESHOLD_BYTES:
+                with open(file_path, 'rb') as f:
+                    is_array = f.read(64).lstrip().startswith(b'[')
+                if is_array:
+                    return DataLoader._stream_json_array(file_path)
+            return orjson.loads(file_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            logger.error(f"Error reading JSON file {file_path}", exc_info=True)
+            return None
+
+    @staticmethod
+    def _stream_json_array(file_path: Path) -> Iterator[Dict[str, Any]]:
+        """Yield the records of a JSON array file one at a time."""
+        try:
+            with open(file_path, 'rb') as f:
+                yield from ijson.items(f, 'item', use_float=True)
+        except (OSError, ijson.JSONError):
+            logger.error(f"Error streaming JSON file {file_path}", exc_info=True)
+
+    @staticmethod
+    def _attach_graphql_views(transcript: CallTranscript) -> None:
+        """Build the GraphQL entry and sentiment objects for a transcript once."""
+        # Imported here since the GraphQL types module imports this one
+        from app.graphql.data_types import SentimentType, TranscriptEntry
+
+        transcript._gql_entries = [
+            TranscriptEntry(
+                speaker=entry.get('speaker', ''),
+                text=entry.get('text', ''),
+                timestamp=entry.get('timestamp', '')
+            )
+            for entry in (transcript.transcript or [])
+            if isinstance(entry, dict)
+        ]
+
+        sentiment = transcript.sentiment or {}
+        transcript._gql_sentiment = SentimentType(
+            polarity=float(sentiment.get('polarity', 0.0)),
+            subjectivity=float(sentiment.get('subjectivity', 0.0)),
+            analyzer=sentiment.get('analyzer')
+        )
+
+    def reload_if_stale(self) -> bool:
+        """Reload cached data if any data file changed since it was loaded.
+
+        The new data is built while the old data stays in place, then swapped
+        in, so searches running in worker threads never see it missing.
+
+        Returns:
+            True if the data was reloaded, False if it is still current
+        """
+        with self._lock:
+            mtime = self._get_data_mtime()
+            if self._data_mtime is None or mtime == self._data_mtime:
+                self._data_mtime = mtime
+                return False
+
+            logger.info(f"Data files in {self.data_dir} changed, reloading")
+            self._data_mtime = mtime
+            if self._customers_loaded:
+                self._read_customers()
+            if self._transcripts_loaded:
+                self._read_transcripts()
+            self._match_cache.clear()
+            self._unfiltered_results = {}
+            self.generation += 1
+            return True
+
+    def _check_stale(self) -> None:
+        """Reload changed data files, checking them at most every few seconds."""
+        now = time.monotonic()
+        if now < self._next_stale_check:
+            return
+        self._next_stale_check = now + _STALE_CHECK_INTERVAL_SECONDS
+        self.reload_if_stale()
+
+    def _ensure_customers_loaded(self) -> Dict[str, Customer]:
+        """Return the loaded customers, loading them on first use only."""
+        if self._customers_loaded:
+            self._check_stale()
+            return self._customers
+        return self.load_customers()
+
+    def _ensure_transcripts_loaded(self) -> Dict[str, CallTranscript]:
+        """Return the loaded transcripts, loading them on first use only."""
+        if self._transcripts_loaded:
+            self._check_stale()
+            return self._transcripts
+        return self.load_transcripts()
 
     def load_customers(self) -> Dict[str, Customer]:
         """Load all customer data."""
-        if self._customers is None:
-            customers_file = self.data_dir / "customers.json"
-            with open(customers_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self._customers = {}
-                for cust_data in data.get('customers', []):
-                    # Process employment data to handle work_address
-                    if 'employment' in cust_data and 'work_address' in cust_data['employment']:
-                        work_addr = cust_data['employment']['work_address']
-                        if work_addr and not isinstance(work_addr, dict):
-                            # If work_address is not a dict, set it to None
-                            cust_data['employment']['work_address'] = None
-
-                    # Create Customer instance
-                    try:
-                        customer = Customer(**cust_data)
-                        self._customers[customer.customer_id] = customer
-                    except Exception as e:
-                        logger.error(f"Error loading customer {cust_data.get('customer_id')}", exc_info=True)
-                        continue
+        if self._customers_loaded:
+            return self._customers
 
+        # Searches may run in worker threads; only one of them should load
+        with self._lock:
+            if not self._customers_loaded:
+                self._read_customers()
         return self._customers
 
+    def _read_customers(self) -> None:
+        """Read customers.json into the customer cache."""
+        if self._data_mtime is None:
+            self._data_mtime = self._get_data_mtime()
+
+        customers_file = self.data_dir / "customers.json"
+        data = orjson.loads(customers_file.read_bytes())
+        # Built aside and swapped in at the end, so a reload never exposes
+        # half-loaded data to concurrent searches
+        customers: Dict[str, Customer] = {}
+        customer_index = TrigramIndex()
+        for cust_data in data.get('customers', []):
+            # Process employment data to handle work_address
+            if 'employment' in cust_data and 'work_address' in cust_data['employment']:
+                work_addr = cust_data['employment']['work_address']
+                if work_addr and not isinstance(work_addr, dict):
+                    # If work_address is not a dict, set it to None
+                    cust_data['employment']['work_address'] = None
+
+            # Create Customer instance
+            try:
+                customer = Customer(**cust_data)
+                customer._search_fields = _customer_search_fields(customer)
+                customer._searchable = ' '.join(customer._search_fields)
+                customers[customer.customer_id] = customer
+                customer_index.add(customer.customer_id, (customer._searchable,))
+            except Exception as e:
+                logger.error(f"Error loading customer {cust_data.get('customer_id')}", exc_info=True)
+                continue
+
+        customers_df = pd.DataFrame(
+            {
+                'customer_id': [c.customer_id for c in customers.values()],
+                'state_upper': [
+                    (c.home_address.get('state', '') or '').upper()
+                    for c in customers.values()
+                ],
+                'fullname_lower': [
+                    f"{(c.personal_info.get('first_name', '') or '').lower()} "
+                    f"{(c.personal_info.get('last_name', '') or '').lower()}"
+                    for c in customers.values()
+                ],
+            },
+            columns=['customer_id', 'state_upper', 'fullname_lower']
+        )
+
+        self._customers = customers
+        self._customer_index = customer_index
+        self._customers_df = customers_df
+        self._customers_loaded = True
+
     def load_transcripts(self) -> Dict[str, CallTranscript]:
         """Load all call transcripts from JSON files with sentiment and context analysis."""
-        if self._transcripts is None:
-            self._transcripts = {}
-            transcripts_dir = self.data_dir / "transcripts"
-
-            for file_path in transcripts_dir.glob("*.json"):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                    # Handle both list and single transcript formats
-                    if isinstance(data, list):
-                        for item in data:
-                            # Ensure we have the required fields with defaults
-                            if 'sentiment' not in item:
-                                item['sentiment'] = {}
-                            if 'contexts' not in item:
-                                item['contexts'] = []
-
-                            # Create the transcript (this will trigger the analysis)
-                            try:
-                                transcript = CallTranscript(**item)
-                                # If the call_summary is empty, we need to manually analyze it
-                                if not transcript.call_summary.strip():
-                                    transcript.sentiment = {}
-                                    transcript.contexts = []
-                                self._transcripts[transcript.call_id] = transcript
-                            except Exception as e:
-                                logger.error(f"Error loading transcript from {file_path}", exc_info=True)
-                                continue
-                    else:
-                        # Ensure we have the required fields with defaults
-                        if 'sentiment' not in data:
-                            data['sentiment'] = {}
-                        if 'contexts' not in data:
-                            data['contexts'] = []
-
-                        # Create the transcript (this will trigger the analysis)
-                        try:
-                            transcript = CallTranscript(**data)
-                            # If the call_summary is empty, we need to manually analyze it
-                            if not transcript.call_summary.strip():
-                                transcript.sentiment = {}
-                                transcript.contexts = []
-                            self._transcripts[transcript.call_id] = transcript
-                        except Exception as e:
-                            logger.error(f"Error loading transcript from {file_path}", exc_info=True)
-                            continue
+        if self._transcripts_loaded:
+            return self._transcripts
 
+        with self._lock:
+            if not self._transcripts_loaded:
+                self._read_transcripts()
         return self._transcripts
 
+    def _read_transcripts(self) -> None:
+        """Read and analyze all transcript files into the transcript cache."""
+        if self._data_mtime is None:
+            self._data_mtime = self._get_data_mtime()
+
+        # Built aside and swapped in at the end, like the customers
+        transcripts: Dict[str, CallTranscript] = {}
+        transcript_index = TrigramIndex()
+        transcripts_dir = self.data_dir / "transcripts"
+        file_paths = sorted(transcripts_dir.glob("*.json"))
+
+        # File reads and JSON parsing run in parallel; the models are built
+        # serially below since the NLP analysis is not thread-friendly.
+        with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as executor:
+            parsed = list(executor.map(self._read_json_file, file_paths))
+
+        for file_path, data in zip(file_paths, parsed):
+            if data is None:
+                continue
+
+            # Handle both list (or streamed) and single transcript formats
+            items = [data] if isinstance(data, dict) else data
+            for item in items:
+                # Ensure we have the required fields with defaults
+                if 'sentiment' not in item:
+                    item['sentiment'] = {}
+                if 'contexts' not in item:
+                    item['contexts'] = []
+
+                # Create the transcript (this will trigger the analysis)
+                try:
+                    transcript = CallTranscript.from_trusted(item)
+                    # If the call_summary is empty, we need to manually analyze it
+                    if not transcript.call_summary.strip():
+                        transcript.sentiment = {}
+                        transcript.contexts = []
+                    self._attach_graphql_views(transcript)
+                    transcript._summary_lower = (transcript.call_summary or '').lower()
+                    transcript._entry_texts_lower = tuple(
+                        (entry.get('text', '') or '').lower()
+                        for entry in (transcript.transcript or [])
+                        if isinstance(entry, dict)
+                    )
+                    transcript._all_text_lower = '\n'.join(
+                        (transcript._summary_lower,) + transcript._entry_texts_lower
+                    )
+                    transcript._contexts_lower = frozenset(c.lower() for c in transcript.contexts or [])
+                    transcript._call_ts_epoch = _timestamp_epoch(transcript.call_timestamp)
+                    transcripts[transcript.call_id] = transcript
+                    transcript_index.add(transcript.call_id, (transcript._all_text_lower,))
+                except Exception as e:
+                    logger.error(f"Error loading transcript from {file_path}", exc_info=True)
+                    continue
+
+        # Index transcripts by customer for per-customer lookups
+        by_customer: Dict[str, List[CallTranscript]] = {}
+        for transcript in transcripts.values():
+            by_customer.setdefault(transcript.customer_id, []).append(transcript)
+
+        customer_transcript_stats: Dict[str, Tuple[int, Optional[str]]] = {}
+        last_contact_epoch: Dict[str, int] = {}
+        for customer_id, customer_transcripts in by_customer.items():
+            latest = max(customer_transcripts, key=lambda t: t._call_ts_epoch)
+            customer_transcript_stats[customer_id] = (len(customer_transcripts), latest.call_timestamp)
+            last_contact_epoch[customer_id] = latest._call_ts_epoch
+
+        transcripts_df = pd.DataFrame(
+            {
+                'call_id': [t.call_id for t in transcripts.values()],
+                'customer_id': [t.customer_id for t in transcripts.values()],
+                'agent_id': [t.agent_id for t in transcripts.values()],
+                'call_date': pd.to_datetime(
+                    [(t.call_timestamp or '').split('T')[0] for t in transcripts.values()],
+                    errors='coerce'
+                ),
+            },
+            columns=['call_id', 'customer_id', 'agent_id', 'call_date']
+        )
+
+        self._transcripts = transcripts
+        self._transcript_index = transcript_index
+        self._by_customer = by_customer
+        self._customer_transcript_stats = customer_transcript_stats
+        self._last_contact_epoch = last_contact_epoch
+        self._transcripts_df = transcripts_df
+        self._transcripts_loaded = True
+
+    def _cached_matches(
+        self,
+        kind: str,
+        query: str,
+        compute: Callable[[str], FrozenSet[str]]
+    ) -> FrozenSet[str]:
+        """Return the IDs matching a full-text query, reusing recent results."""
+        key = (kind, query.lower())
+        with self._lock:
+            generation = self.generation
+            matches = self._match_cache.get(key)
+            if matches is not None:
+                self._match_cache.move_to_end(key)
+                return matches
+
+        matches = compute(key[1])
+        with self._lock:
+            # Results computed against data that has since been reloaded are dropped
+            if generation != self.generation:
+                return matches
+            self._match_cache[key] = matches
+            while len(self._match_cache) > _MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        return matches
+
+    def _match_customers(self, needle: str) -> FrozenSet[str]:
+        """Find the customers whose joined search fields contain needle."""
+        customers = self._customers
+        candidate_ids = self._customer_index.candidates(needle)
+        if candidate_ids is None:
+            candidate_ids = customers.keys()
+        return frozenset(
+            customer_id for customer_id in candidate_ids
+            if needle in customers[customer_id]._searchable
+        )
+
+    def _match_transcripts(self, needle: str) -> FrozenSet[str]:
+        """Find the transcripts whose summary or entries contain needle."""
+        transcripts = self._transcripts
+        candidate_ids = self._transcript_index.candidates(needle)
+        if candidate_ids is None:
+            candidate_ids = transcripts.keys()
+        return frozenset(
+            call_id for call_id in candidate_ids
+            if needle in (transcripts[call_id]._all_text_lower or '')
+        )
+
+    def get_customers(self) -> Dict[str, Customer]:
+        """Get all customers keyed by ID, reloading them if their file changed."""
+        return self._ensure_customers_loaded()
+
     def get_customer(self, customer_id: str) -> Optional[Customer]:
         """Get a single customer by ID."""
-        customers = self.load_customers()
-        return customers.get(customer_id)
+        return self._ensure_customers_loaded().get(customer_id)
 
     def get_transcript(self, call_id: str) -> Optional[CallTranscript]:
         """Get a single call transcript by ID."""
-        transcripts = self.load_transcripts()
-        return transcripts.get(call_id)
+        return self._ensure_transcripts_loaded().get(call_id)
 
     def search_customers(
         self,
         name: Optional[str] = None,
         state: Optional[str] = None,
         transcript_text: Optional[str] = None,
+        query: Optional[str] = None,
         limit: int = 10,
         offset: int = 0
     ) -> List[Customer]:
@@ -735,53 +1194,200 @@ class DataLoader:
             name: Optional name to search for (partial match)
             state: Optional state to filter by
             transcript_text: Optional text to search within customer transcripts
+            query: Optional full-text search across name, email, company, city and state
             limit: Maximum number of results to return
             offset: Number of results to skip
 
         Returns:
             List of matching Customer objects
         """
-        customers = list(self.load_customers().values())
+        customers = self._ensure_customers_loaded()
+        matched_ids = self._filter_customer_ids(name, state, transcript_text, query)
+
+        # Apply pagination
+        return [customers[customer_id] for customer_id in matched_ids.iloc[offset:offset + limit]]
+
+    def _filter_customer_ids(
+        self,
+        name: Optional[str] = None,
+        state: Optional[str] = None,
+        transcript_text: Optional[str] = None,
+        query: Optional[str] = None
+    ) -> pd.Series:
+        """Return the IDs of the customers passing the indexed filters, in load order."""
+        self._ensure_customers_loaded()
+        df = self._customers_df
+        mask = pd.Series(True, index=df.index)
+
+        # Filter by name if provided
+        if name:
+            mask &= df['fullname_lower'].str.contains(name.lower(), regex=False)
+
+        # Filter by state if provided
+        if state:
+            mask &= df['state_upper'] == state.upper()
 
         # If searching by transcript text, we need to find customer IDs with matching transcripts first
-        customer_ids_with_matching_transcripts = set()
         if transcript_text:
-            transcripts = self.load_transcripts().values()
-            search_text = transcript_text.lower()
+            customer_ids_with_matching_transcripts = set()
+            transcripts = self._ensure_transcripts_loaded().values()
+            pattern = _compile_needle(transcript_text)
 
             for transcript in transcripts:
-                # Search in call summary
-                if search_text in (transcript.call_summary or '').lower():
-                    customer_ids_with_matching_transcripts.add(transcript.customer_id)
+                # One match per customer is enough
+                if transcript.customer_id in customer_ids_with_matching_transcripts:
                     continue
 
-                # Search in transcript entries
-                for entry in (transcript.transcript or []):
-                    if search_text in (entry.get('text', '') or '').lower():
-                        customer_ids_with_matching_transcripts.add(transcript.customer_id)
-                        break
+                # Search the call summary and all entry texts at once
+                if pattern.search(transcript._all_text_lower or ''):
+                    customer_ids_with_matching_transcripts.add(transcript.customer_id)
 
-        filtered = []
-        for cust in customers:
-            # Filter by name if provided
-            if name and name.lower() not in (
-                f"{cust.personal_info.get('first_name', '').lower()} "
-                f"{cust.personal_info.get('last_name', '').lower()}"
-            ):
-                continue
+            mask &= df['customer_id'].isin(customer_ids_with_matching_transcripts)
+
+        if query:
+            mask &= df['customer_id'].isin(
+                self._cached_matches('customers', query, self._match_customers)
+            )
 
-            # Filter by state if provided
-            if state and state.upper() != cust.home_address.get('state', '').upper():
+        return df.loc[mask, 'customer_id']
+
+    def query_customers(
+        self,
+        query: Optional[str] = None,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        state: Optional[str] = None,
+        city: Optional[str] = None,
+        company: Optional[str] = None,
+        has_transcripts: Optional[bool] = None,
+        min_transcripts: Optional[int] = None,
+        last_contact_days: Optional[int] = None,
+        sort_by: str = "relevance",
+        sort_order: str = "desc",
+        limit: int = 10,
+        offset: int = 0
+    ) -> SearchPage:
+        """Filter, sort and paginate customers in a single pass.
+
+        Args:
+            query: Full-text search across name, email, company, city and state
+            name: Partial match on the customer's full name
+            email: Partial match on the email address
+            phone: Partial match on the phone number
+            state: Exact match on the state
+            city: Partial match on the city
+            company: Partial match on the company name
+            has_transcripts: Only customers with (or without) transcripts
+            min_transcripts: Minimum number of transcripts
+            last_contact_days: Maximum days since the latest call
+            sort_by: 'relevance', 'name', 'last_contact' or 'transcript_count'
+            sort_order: 'asc' or 'desc'; relevance is always descending
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            SearchPage holding the requested Customer objects and the total match count
+        """
+        # Read before the data so results from a since-reloaded dataset are not cached
+        generation = self.generation
+        customers = self._ensure_customers_loaded()
+        self._ensure_transcripts_loaded()
+
+        # Unfiltered listings are served from a cached, fully ordered list
+        unfiltered = not any((query, name, email, phone, state, city, company)) and all(
+            value is None for value in (has_transcripts, min_transcripts, last_contact_days)
+        )
+        cache_key = ('customers', sort_by, sort_order.lower())
+        if unfiltered:
+            ordered = self._unfiltered_results.get(cache_key)
+            if ordered is not None:
+                return SearchPage(ordered[offset:offset + limit], len(ordered))
+
+        stats = self._customer_transcript_stats
+        last_contact_epoch = self._last_contact_epoch
+        email = email.lower() if email else None
+        city = city.lower() if city else None
+        company = company.lower() if company else None
+        now = time.time()
+
+        matches = []
+        for customer_id in self._filter_customer_ids(name=name, state=state, query=query):
+            customer = customers[customer_id]
+            personal_info = customer.personal_info or {}
+            home_address = customer.home_address or {}
+
+            if email and email not in (personal_info.get('email') or '').lower():
+                continue
+            if phone and phone not in (personal_info.get('phone') or ''):
+                continue
+            if city and city not in (home_address.get('city') or '').lower():
+                continue
+            if company and company not in (customer.employment.company or '').lower():
                 continue
 
-            # Filter by transcript text if provided
-            if transcript_text and cust.customer_id not in customer_ids_with_matching_transcripts:
+            transcript_count, last_contact = stats.get(customer_id, (0, None))
+            if has_transcripts is not None and has_transcripts != (transcript_count > 0):
+                continue
+            if min_transcripts is not None and transcript_count < min_transcripts:
                 continue
+            if last_contact_days is not None and last_contact:
+                if (now - last_contact_epoch[customer_id]) // 86400 > last_contact_days:
+                    continue
 
-            filtered.append(cust)
+            matches.append(customer)
+
+        reverse = sort_order.lower() == 'desc'
+        sort_key = None
+        if sort_by == 'relevance' and query:
+            needle = query.lower()
+            sort_key = lambda c: _customer_relevance(c, needle)
+            reverse = True
+        elif sort_by == 'name':
+            sort_key = lambda c: f"{c.personal_info.get('last_name', '')} " \
+                                 f"{c.personal_info.get('first_name', '')}".lower()
+        elif sort_by == 'last_contact':
+            sort_key = lambda c: last_contact_epoch.get(c.customer_id, 0)
+        elif sort_by == 'transcript_count':
+            sort_key = lambda c: stats.get(c.customer_id, (0, None))[0]
+
+        if unfiltered:
+            ordered = sorted(matches, key=sort_key, reverse=reverse) if sort_key else matches
+            if generation == self.generation:
+                self._unfiltered_results[cache_key] = ordered
+            return SearchPage(ordered[offset:offset + limit], len(ordered))
+
+        # Only the rows up to the end of the requested page need ordering
+        if sort_key is not None:
+            page = _top_k(matches, offset + limit, sort_key, reverse)[offset:]
+        else:
+            page = matches[offset:offset + limit]
 
-        # Apply pagination
-        return filtered[offset:offset + limit]
+        return SearchPage(page, len(matches))
+
+    def get_transcripts_for_customers(self, customer_ids: List[str]) -> Dict[str, List[CallTranscript]]:
+        """Get all transcripts for several customers in a single pass.
+
+        Args:
+            customer_ids: IDs of the customers to fetch transcripts for
+
+        Returns:
+            Dictionary mapping each requested customer ID to its transcripts
+        """
+        self._ensure_transcripts_loaded()
+        return {
+            customer_id: list(self._by_customer.get(customer_id, []))
+            for customer_id in customer_ids
+        }
+
+    def get_customer_transcript_stats(self, customer_id: str) -> Tuple[int, Optional[str]]:
+        """Get a customer's transcript count and latest call timestamp.
+
+        Returns:
+            (0, None) for customers without transcripts
+        """
+        self._ensure_transcripts_loaded()
+        return self._customer_transcript_stats.get(customer_id, (0, None))
 
     def search_transcripts(
         self,
@@ -789,61 +1395,219 @@ class DataLoader:
         agent_id: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        query: Optional[str] = None,
         limit: int = 10,
         offset: int = 0
     ) -> List[CallTranscript]:
-        """Search call transcripts with optional filters."""
-        transcripts = list(self.load_transcripts().values())
+        """Search call transcripts with optional filters.
+
+        query matches the call summary and transcript entry texts.
+        """
+        transcripts = self._ensure_transcripts_loaded()
+        matched_ids = self._filter_transcript_ids(customer_id, agent_id, start_date, end_date, query)
+        return [transcripts[call_id] for call_id in matched_ids.iloc[offset:offset + limit]]
+
+    def _filter_transcript_ids(
+        self,
+        customer_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        query: Optional[str] = None,
+        customer_ids: Optional[Collection[str]] = None
+    ) -> pd.Series:
+        """Return the IDs of the transcripts passing the indexed filters, in load order."""
+        self._ensure_transcripts_loaded()
+        df = self._transcripts_df
+        mask = pd.Series(True, index=df.index)
+
+        if customer_id:
+            mask &= df['customer_id'] == customer_id
+
+        if customer_ids is not None:
+            mask &= df['customer_id'].isin(customer_ids)
+
+        if agent_id:
+            mask &= df['agent_id'] == agent_id
+
+        if start_date:
+            mask &= df['call_date'] >= pd.Timestamp(datetime.fromisoformat(start_date))
+
+        if end_date:
+            mask &= df['call_date'] <= pd.Timestamp(datetime.fromisoformat(end_date))
+
+        if query:
+            mask &= df['call_id'].isin(
+                self._cached_matches('transcripts', query, self._match_transcripts)
+            )
+
+        return df.loc[mask, 'call_id']
 
-        filtered = []
-        for trans in transcripts:
-            if customer_id and trans.customer_id != customer_id:
+    def query_transcripts(
+        self,
+        query: Optional[str] = None,
+        customer_id: Optional[str] = None,
+        customer_name: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        call_type: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None,
+        min_sentiment: Optional[float] = None,
+        max_sentiment: Optional[float] = None,
+        has_context: Optional[bool] = None,
+        context: Optional[str] = None,
+        is_ada_related: Optional[bool] = None,
+        ada_violation_occurred: Optional[bool] = None,
+        sort_by: str = "date",
+        sort_order: str = "desc",
+        limit: int = 10,
+        offset: int = 0
+    ) -> SearchPage:
+        """Filter, sort, paginate and aggregate transcripts in a single pass.
+
+        Args:
+            query: Full-text search across the call summary and transcript entries
+            customer_id: Exact match on the customer ID
+            customer_name: Partial match on the customer's full name
+            agent_id: Exact match on the agent ID
+            call_type: Exact match on the call type
+            start_date: Earliest call date (YYYY-MM-DD or ISO format)
+            end_date: Latest call date (YYYY-MM-DD or ISO format)
+            min_duration: Minimum call duration in seconds
+            max_duration: Maximum call duration in seconds
+            min_sentiment: Minimum sentiment polarity
+            max_sentiment: Maximum sentiment polarity
+            has_context: Only transcripts with (or without) extracted contexts
+            context: A context the transcript must have (case-insensitive)
+            is_ada_related: Match on the ADA-related flag
+            ada_violation_occurred: Match on the ADA violation flag
+            sort_by: 'date', 'duration', 'sentiment' or 'relevance'
+            sort_order: 'asc' or 'desc'; relevance is always descending
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            SearchPage holding the requested CallTranscript objects, the total match
+            count and aggregations over all matches
+        """
+        generation = self.generation
+        transcripts = self._ensure_transcripts_loaded()
+
+        # Unfiltered listings are served from a cached, fully ordered list
+        unfiltered = not any((query, customer_id, customer_name, agent_id, call_type, start_date,
+                              end_date, context)) and all(
+            value is None
+            for value in (min_duration, max_duration, min_sentiment, max_sentiment,
+                          has_context, is_ada_related, ada_violation_occurred)
+        )
+        cache_key = ('transcripts', sort_by, sort_order.lower())
+        if unfiltered:
+            cached = self._unfiltered_results.get(cache_key)
+            if cached is not None:
+                ordered, aggregations = cached
+                return SearchPage(ordered[offset:offset + limit], len(ordered), aggregations)
+
+        context = context.lower() if context else None
+
+        # Resolve the customer name filter to customer IDs once, up front
+        customer_ids = (
+            self._filter_customer_ids(name=customer_name).tolist() if customer_name else None
+        )
+
+        # Aggregations are accumulated for the survivors while filtering
+        matches = []
+        sentiments: List[float] = []
+        call_type_counts: Counter = Counter()
+        total_duration = 0
+        for call_id in self._filter_transcript_ids(
+            customer_id, agent_id, start_date, end_date, query, customer_ids
+        ):
+            transcript = transcripts[call_id]
+
+            if call_type and transcript.call_type != call_type:
                 continue
 
-            if agent_id and trans.agent_id != agent_id:
+            duration = transcript.call_duration_seconds or 0
+            if min_duration is not None and duration < min_duration:
+                continue
+            if max_duration is not None and duration > max_duration:
                 continue
 
-            if start_date:
-                call_date = datetime.fromisoformat(trans.call_timestamp.split('T')[0])
-                start = datetime.fromisoformat(start_date)
-                if call_date < start:
-                    continue
+            sentiment = (transcript.sentiment or {}).get('polarity', 0)
+            if min_sentiment is not None and sentiment < min_sentiment:
+                continue
+            if max_sentiment is not None and sentiment > max_sentiment:
+                continue
 
-            if end_date:
-                call_date = datetime.fromisoformat(trans.call_timestamp.split('T')[0])
-                end = datetime.fromisoformat(end_date)
-                if call_date > end:
-                    continue
+            if has_context is not None and has_context != bool(transcript.contexts):
+                continue
+            if context and context not in transcript._contexts_lower:
+                continue
+
+            if is_ada_related is not None and transcript.is_ada_related != is_ada_related:
+                continue
+            if ada_violation_occurred is not None and transcript.ada_violation_occurred != ada_violation_occurred:
+                continue
+
+            matches.append(transcript)
+            sentiments.append(sentiment)
+            total_duration += duration
+            if transcript.call_type:
+                call_type_counts[transcript.call_type] += 1
+
+        reverse = sort_order.lower() == 'desc'
+        sort_key = None
+        # attrgetter keys run in C; every transcript has both attributes
+        if sort_by == 'date':
+            sort_key = operator.attrgetter('_call_ts_epoch')
+        elif sort_by == 'duration':
+            sort_key = operator.attrgetter('call_duration_seconds')
+        elif sort_by == 'sentiment':
+            sort_key = lambda t: (t.sentiment or {}).get('polarity', 0)
+        elif sort_by == 'relevance' and query:
+            needle = query.lower()
+            sort_key = lambda t: _transcript_relevance(t, needle)
+            reverse = True
+
+        # Sentiment statistics are vectorized reductions over the collected scores
+        sentiment_array = np.array(sentiments, dtype=np.float64)
+        has_sentiments = sentiment_array.size > 0
+
+        aggregations = {
+            'call_types': dict(sorted(call_type_counts.items())),
+            'sentiment': {
+                'min': float(sentiment_array.min()) if has_sentiments else None,
+                'max': float(sentiment_array.max()) if has_sentiments else None,
+                'avg': float(sentiment_array.mean()) if has_sentiments else None,
+                'count': int(sentiment_array.size)
+            },
+            'total_duration': total_duration,
+            'total_count': len(matches)
+        }
+
+        if unfiltered:
+            ordered = sorted(matches, key=sort_key, reverse=reverse) if sort_key else matches
+            if generation == self.generation:
+                self._unfiltered_results[cache_key] = (ordered, aggregations)
+            return SearchPage(ordered[offset:offset + limit], len(ordered), aggregations)
 
-            filtered.append(trans)
+        # Only the rows up to the end of the requested page need ordering
+        if sort_key is not None:
+            page = _top_k(matches, offset + limit, sort_key, reverse)[offset:]
+        else:
+            page = matches[offset:offset + limit]
 
-        return filtered[offset:offset + limit]
+        return SearchPage(page, len(matches), aggregations)
 
     def get_customers_with_transcripts(self) -> List[Customer]:
         """Get all customers that have at least one transcript."""
-        # Get all customers and transcripts
-        customers = list(self.load_customers().values())
-        transcripts = self.load_transcripts()
+        customers = self._ensure_customers_loaded()
+        self._ensure_transcripts_loaded()
 
-        # Create a dictionary of customer IDs to their transcripts
-        customer_transcripts = {}
-        for transcript in transcripts.values():
-            if not hasattr(transcript, 'customer_id') or not transcript.customer_id:
-                continue
-            if transcript.customer_id not in customer_transcripts:
-                customer_transcripts[transcript.customer_id] = []
-            customer_transcripts[transcript.customer_id].append(transcript)
-
-        # Filter customers to only those with at least one transcript
-        result = []
-        for customer in customers:
-            if customer.customer_id in customer_transcripts and customer_transcripts[customer.customer_id]:
-                # Double-check that the customer has at least one transcript
-                customer_transcript_count = len(customer_transcripts[customer.customer_id])
-                if customer_transcript_count > 0:
-                    result.append(customer)
-
-        return result
+        # The customer index only holds customers with at least one transcript
+        return [c for c in customers.values() if c.customer_id in self._by_customer]
 
 # Singleton instance
 data_loader = DataLoader()
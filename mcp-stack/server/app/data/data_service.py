@@ -4,6 +4,8 @@ Data service module for handling data operations.
 from typing import List, Dict, Any, Optional
 import logging
 
+from .search_index import TrigramIndex
+
 logger = logging.getLogger(__name__)
 
 class DataService:
@@ -11,6 +13,7 @@ class DataService:
 
     def __init__(self):
         self.data_store = {}
+        self._index = TrigramIndex()
         logger.info("DataService initialized")
 
     async def get_data(self, data_id: str) -> Optional[Dict[str, Any]]:
@@ -20,14 +23,25 @@ class DataService:
     async def store_data(self, data_id: str, data: Dict[str, Any]) -> bool:
         """Store data with the given ID."""
         self.data_store[data_id] = data
+        if isinstance(data, dict):
+            self._index.add(data_id, (str(value) for value in data.values()))
+        else:
+            self._index.remove(data_id)
         return True
 
     async def search_data(self, query: str) -> List[Dict[str, Any]]:
         """Search for data matching the query."""
-        # Simple search implementation - can be enhanced based on requirements
         query = query.lower()
+
+        # Narrow down to candidates via the trigram index, then verify each one
+        candidate_ids = self._index.candidates(query)
+        if candidate_ids is None:
+            candidates = self.data_store.values()
+        else:
+            candidates = (self.data_store[data_id] for data_id in candidate_ids)
+
         return [
-            data for data in self.data_store.values()
+            data for data in candidates
             if isinstance(data, dict) and
             any(query in str(value).lower() for value in data.values())
         ]
@@ -1,8 +1,12 @@
 """
 NLTK Setup Module
 ----------------
-This module ensures NLTK and its required data are properly set up.
-It runs automatically when the data package is imported.
+This module configures where NLTK looks for its data.
+
+Importing it only points NLTK at the known data directories, which is cheap.
+Missing data is downloaded by ensure_nltk_ready(), which runs from the FastAPI
+startup hook or explicitly via ``python -m app.data.nltk_setup``. Set
+AUTO_DOWNLOAD_NLTK to also download missing data on import.
 """
 import os
 import sys
@@ -11,6 +15,15 @@ import platform
 import shutil
 from pathlib import Path
 
+# NLTK packages the data module needs, with the resource each one provides
+REQUIRED_DATA = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+    'vader_lexicon': 'sentiment/vader_lexicon',
+}
+
 def ensure_nltk_installed():
     """Ensure NLTK is installed, install it if necessary."""
     try:
@@ -27,50 +40,91 @@ def ensure_nltk_installed():
             print(f"❌ Failed to install NLTK: {e}")
             return False
 
-def setup_nltk_data():
-    """Set up NLTK data directory and download required packages."""
-    if not ensure_nltk_installed():
-        return None
-
-    import nltk
-
-    # Define required NLTK data packages
-    required_data = [
-        'punkt',
-        'stopwords',
-        'wordnet',
-        'averaged_perceptron_tagger',
-        'vader_lexicon'
-    ]
-
-    # Try multiple possible NLTK data locations
-    possible_paths = [
+def _possible_data_paths():
+    """Return the NLTK data locations used by this project, in priority order."""
+    return [
         Path.home() / 'nltk_data',
         Path(__file__).parent / 'nltk_data',
         Path.cwd() / 'nltk_data'
     ]
 
-    # Create directories and add to NLTK path
-    nltk_data_dirs = []
-    for path in possible_paths:
+def configure_nltk_data_path():
+    """Add the project's NLTK data directories to NLTK's search path.
+
+    This does not touch the network or create directories.
+
+    Returns:
+        The directory that downloads go to
+    """
+    import nltk
+
+    existing = [str(path) for path in _possible_data_paths() if path.is_dir()]
+    nltk.data.path = existing + [p for p in nltk.data.path if p not in existing]
+    return str(_possible_data_paths()[0])
+
+def missing_nltk_data():
+    """Return the names of required NLTK packages that are not installed."""
+    import nltk
+
+    missing = []
+    for package, resource in REQUIRED_DATA.items():
         try:
-            path.mkdir(parents=True, exist_ok=True)
-            nltk_data_dirs.append(str(path))
-            print(f"✓ Using NLTK data directory: {path}")
-        except Exception as e:
-            print(f"⚠ Could not create NLTK data directory at {path}: {e}")
+            nltk.data.find(resource)
+        except LookupError:
+            missing.append(package)
+    return missing
 
-    if not nltk_data_dirs:
-        print("❌ No valid NLTK data directories could be created")
+def _link_directory(source, target):
+    """Make target point at source without copying the data if possible.
+
+    Tries a directory symlink first (needs developer mode or admin on Windows),
+    then an NTFS junction, and only copies the tree as a last resort.
+    """
+    try:
+        os.symlink(source, target, target_is_directory=True)
+        return
+    except OSError:
+        pass
+
+    try:
+        subprocess.run(
+            ['cmd', '/c', 'mklink', '/J', str(target), str(source)],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        return
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    shutil.copytree(source, target)
+
+def ensure_nltk_ready():
+    """Download any missing NLTK data and prepare punkt_tab if needed.
+
+    Returns:
+        The NLTK data directory, or None if NLTK is unavailable
+    """
+    if not ensure_nltk_installed():
         return None
 
-    # Add all valid paths to NLTK's data path
-    nltk.data.path = nltk_data_dirs + nltk.data.path
+    import nltk
+
+    data_dir = Path(configure_nltk_data_path())
+    missing = missing_nltk_data()
+
+    if missing:
+        try:
+            data_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            print(f"⚠ Could not create NLTK data directory at {data_dir}: {e}")
+            return None
+        if str(data_dir) not in nltk.data.path:
+            nltk.data.path.insert(0, str(data_dir))
 
-    # Download required NLTK data
-    for data in required_data:
+    for data in missing:
         try:
-            nltk.download(data, quiet=True)
+            nltk.download(data, download_dir=str(data_dir), quiet=True)
             print(f"✓ Downloaded NLTK data: {data}")
         except Exception as e:
             print(f"⚠ Failed to download NLTK data '{data}': {e}")
@@ -79,7 +133,7 @@ def setup_nltk_data():
     if platform.system() == 'Windows':
         try:
             punkt_dir = None
-            for path in nltk_data_dirs:
+            for path in nltk.data.path:
                 punkt_path = Path(path) / 'tokenizers' / 'punkt'
                 if punkt_path.exists():
                     punkt_dir = punkt_path
@@ -88,20 +142,40 @@ def setup_nltk_data():
             if punkt_dir:
                 punkt_tab_dir = punkt_dir.parent / 'punkt_tab'
                 if not punkt_tab_dir.exists():
-                    shutil.copytree(punkt_dir, punkt_tab_dir)
+                    _link_directory(punkt_dir, punkt_tab_dir)
                     print(f"✓ Created punkt_tab at {punkt_tab_dir}")
-                else:
-                    print(f"✓ punkt_tab already exists at {punkt_tab_dir}")
         except Exception as e:
             print(f"⚠ Could not create punkt_tab: {e}")
 
-    return nltk_data_dirs[0]
+    return str(data_dir)
+
+def setup_nltk_data():
+    """Set up NLTK data directory and download required packages."""
+    return ensure_nltk_ready()
+
+def _punkt_available():
+    """Cheaply check whether the punkt tokenizer can be found."""
+    import nltk
+
+    try:
+        nltk.data.find(REQUIRED_DATA['punkt'])
+        return True
+    except LookupError:
+        return False
+
+# Only configure the search path on import; downloads are opt-in here
+try:
+    nltk_data_dir = configure_nltk_data_path()
+    if os.getenv("AUTO_DOWNLOAD_NLTK") and not _punkt_available():
+        nltk_data_dir = ensure_nltk_ready()
+except ImportError:
+    nltk_data_dir = None
 
-# Run the setup when this module is imported
-print("\n=== Initializing NLTK Data ===")
-nltk_data_dir = setup_nltk_data()
-if nltk_data_dir:
-    print(f"\n✓ NLTK data initialization complete. Using directory: {nltk_data_dir}")
-else:
-    print("\n⚠ NLTK data initialization completed with warnings")
-print("=" * 30 + "\n")
+if __name__ == "__main__":
+    print("\n=== Initializing NLTK Data ===")
+    nltk_data_dir = ensure_nltk_ready()
+    if nltk_data_dir:
+        print(f"\n✓ NLTK data initialization complete. Using directory: {nltk_data_dir}")
+    else:
+        print("\n⚠ NLTK data initialization completed with warnings")
+    print("=" * 30 + "\n")
@@ -0,0 +1,100 @@
+"""
+In-memory trigram index for fast substring search.
+"""
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+
+# Queries shorter than this cannot be answered from the index
+MIN_QUERY_LENGTH = 3
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Maps lowercased trigrams to the keys of the documents containing them.
+
+    Every substring of length >= 3 shares all of its trigrams with the text it
+    occurs in, so intersecting postings yields a superset of the documents that
+    contain the query. Callers verify the candidates with a plain substring check.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._doc_trigrams: Dict[Hashable, Set[str]] = {}
+        self._positions: Dict[Hashable, int] = {}
+        self._next_position = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_trigrams)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._doc_trigrams
+
+    def add(self, key: Hashable, texts: Iterable[str]) -> None:
+        """Index the given texts under key, replacing any previous entry."""
+        if key in self._doc_trigrams:
+            self.remove(key, keep_position=True)
+
+        trigrams: Set[str] = set()
+        for text in texts:
+            trigrams |= _trigrams(text.lower())
+
+        self._doc_trigrams[key] = trigrams
+        for trigram in trigrams:
+            self._postings.setdefault(trigram, set()).add(key)
+
+        if key not in self._positions:
+            self._positions[key] = self._next_position
+            self._next_position += 1
+
+    def remove(self, key: Hashable, keep_position: bool = False) -> None:
+        """Remove key from the index if present."""
+        trigrams = self._doc_trigrams.pop(key, None)
+        if trigrams is None:
+            return
+
+        for trigram in trigrams:
+            keys = self._postings.get(trigram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[trigram]
+
+        if not keep_position:
+            self._positions.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all documents from the index."""
+        self._postings.clear()
+        self._doc_trigrams.clear()
+        self._positions.clear()
+        self._next_position = 0
+
+    def candidates(self, query: str) -> Optional[List[Hashable]]:
+        """Return keys that may contain query, in insertion order.
+
+        Returns None when the query is too short to use the index, in which
+        case the caller should fall back to a linear scan.
+        """
+        query = query.lower()
+        if len(query) < MIN_QUERY_LENGTH:
+            return None
+
+        # Intersect the rarest postings first to keep the working set small
+        postings = []
+        for trigram in _trigrams(query):
+            keys = self._postings.get(trigram)
+            if not keys:
+                return []
+            postings.append(keys)
+        postings.sort(key=len)
+
+        result = set(postings[0])
+        for keys in postings[1:]:
+            result &= keys
+            if not result:
+                return []
+
+        return sorted(result, key=self._positions.__getitem__)
@@ -1,7 +1,9 @@
 # At the top of data_types.py
 from __future__ import annotations
+import asyncio
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 import strawberry
+from strawberry.types import Info
 from datetime import datetime
 from app.data.data_loader import data_loader
 
@@ -50,39 +52,68 @@ class CallTranscriptType:
         description="List of key contexts extracted from the call"
     )
 
+# Converted objects keyed by call_id / (customer_id, include_transcripts).
+# The loader keeps its models for the life of the process, so the converted
+# objects can be reused until the loader drops its data.
+_transcript_cache: Dict[str, CallTranscriptType] = {}
+_customer_cache: Dict[tuple, CustomerType] = {}
+_cache_generation = data_loader.generation
+
+def _check_cache_generation() -> None:
+    """Clear the conversion caches if the data loader has reloaded."""
+    global _cache_generation
+    if _cache_generation != data_loader.generation:
+        _transcript_cache.clear()
+        _customer_cache.clear()
+        _cache_generation = data_loader.generation
+
 # Now define the methods
 def add_methods():
     # Add from_model to CallTranscriptType
     @classmethod
     def from_model_transcript(cls, transcript):
+        # Plain dicts are converted as-is; only loader models are cached
+        cache_key = None
+        if not isinstance(transcript, dict):
+            _check_cache_generation()
+            cache_key = transcript.call_id
+            cached = _transcript_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         get_attr = lambda x, a: x[a] if isinstance(x, dict) else getattr(x, a, None)
 
-        transcript_data = get_attr(transcript, 'transcript') or []
-        transcript_entries = []
-        for entry in (transcript_data if isinstance(transcript_data, list) else []):
-            if not isinstance(entry, dict):
-                continue
-
-            transcript_entries.append(TranscriptEntry(
-                speaker=entry.get('speaker', ''),
-                text=entry.get('text', ''),
-                timestamp=entry.get('timestamp', '')
-            ))
-
-        # Get sentiment data
-        sentiment_data = get_attr(transcript, 'sentiment') or {}
-        sentiment = SentimentType(
-            polarity=float(sentiment_data.get('polarity', 0.0)),
-            subjectivity=float(sentiment_data.get('subjectivity', 0.0)),
-            analyzer=sentiment_data.get('analyzer')
-        )
+        # Loader models carry prebuilt entry/sentiment objects
+        transcript_entries = getattr(transcript, '_gql_entries', None)
+        sentiment = getattr(transcript, '_gql_sentiment', None)
+
+        if transcript_entries is None:
+            transcript_data = get_attr(transcript, 'transcript') or []
+            transcript_entries = []
+            for entry in (transcript_data if isinstance(transcript_data, list) else []):
+                if not isinstance(entry, dict):
+                    continue
+
+                transcript_entries.append(TranscriptEntry(
+                    speaker=entry.get('speaker', ''),
+                    text=entry.get('text', ''),
+                    timestamp=entry.get('timestamp', '')
+                ))
+
+        if sentiment is None:
+            sentiment_data = get_attr(transcript, 'sentiment') or {}
+            sentiment = SentimentType(
+                polarity=float(sentiment_data.get('polarity', 0.0)),
+                subjectivity=float(sentiment_data.get('subjectivity', 0.0)),
+                analyzer=sentiment_data.get('analyzer')
+            )
 
         # Get contexts
         contexts = get_attr(transcript, 'contexts') or []
         if not isinstance(contexts, list):
             contexts = []
 
-        return cls(
+        result = cls(
             call_id=get_attr(transcript, 'call_id') or '',
             customer_id=get_attr(transcript, 'customer_id') or '',
             call_type=get_attr(transcript, 'call_type') or '',
@@ -96,10 +127,19 @@ def add_methods():
             sentiment=sentiment,
             contexts=contexts
         )
+        if cache_key is not None:
+            _transcript_cache[cache_key] = result
+        return result
 
     # Add from_model to CustomerType
     @classmethod
-    def from_model_customer(cls, customer, include_transcripts: bool = False):
+    def from_model_customer(cls, customer, include_transcripts: bool = False, transcripts=None):
+        _check_cache_generation()
+        cache_key = (customer.customer_id, include_transcripts)
+        cached = _customer_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         email = customer.personal_info.get('email', '')
         phone = customer.personal_info.get('phone', '')
 
@@ -111,12 +151,16 @@ def add_methods():
         city = customer.home_address.get('city', '') if hasattr(customer, 'home_address') and customer.home_address else ''
         state = customer.home_address.get('state', '') if hasattr(customer, 'home_address') and customer.home_address else ''
 
-        transcripts = []
+        transcript_types = []
         if include_transcripts:
-            transcript_models = data_loader.search_transcripts(customer_id=customer.customer_id)
-            transcripts = [CallTranscriptType.from_model(t) for t in transcript_models]
+            # Callers resolving many customers pass preloaded transcripts
+            if transcripts is None:
+                transcripts = data_loader.get_transcripts_for_customers(
+                    [customer.customer_id]
+                )[customer.customer_id]
+            transcript_types = [CallTranscriptType.from_model(t) for t in transcripts]
 
-        return cls(
+        result = cls(
             customer_id=customer.customer_id,
             first_name=customer.personal_info.get('first_name', ''),
             last_name=customer.personal_info.get('last_name', ''),
@@ -124,8 +168,10 @@ def add_methods():
             phone=phone,
             city=city,
             state=state,
-            transcripts=transcripts
+            transcripts=transcript_types
         )
+        _customer_cache[cache_key] = result
+        return result
 
     # Attach methods to classes
     CallTranscriptType.from_model = from_model_transcript
@@ -153,12 +199,31 @@ class TranscriptFilterInput:
     limit: int = 10
     offset: int = 0
 
+def _get_loaders(info: Info) -> Optional[Dict[str, Any]]:
+    """Return the request's DataLoaders, if the context provides them."""
+    context = info.context
+    if isinstance(context, dict):
+        return context.get("loaders")
+    return getattr(context, "loaders", None)
+
+async def _transcripts_for_customers(info: Info, customer_ids: List[str]) -> Dict[str, List[Any]]:
+    """Fetch transcripts for many customers, batched through the request loader."""
+    loaders = _get_loaders(info)
+    if loaders is None:
+        return data_loader.get_transcripts_for_customers(customer_ids)
+    transcripts = await loaders["transcripts_by_customer"].load_many(customer_ids)
+    return dict(zip(customer_ids, transcripts))
+
 # Query class
 @strawberry.type
 class DataQuery:
     @strawberry.field
-    async def get_customer(self, customer_id: str) -> Optional[CustomerType]:
-        customer = data_loader.get_customer(customer_id)
+    async def get_customer(self, info: Info, customer_id: str) -> Optional[CustomerType]:
+        loaders = _get_loaders(info)
+        if loaders is None:
+            customer = data_loader.get_customer(customer_id)
+        else:
+            customer = await loaders["customer"].load(customer_id)
         if customer:
             return CustomerType.from_model(customer)
         return None
@@ -166,16 +231,26 @@ class DataQuery:
     @strawberry.field
     async def search_customers(
         self,
+        info: Info,
         filter: CustomerFilterInput
     ) -> List[CustomerType]:
-        customers = data_loader.search_customers(
+        # Searches scan all data in Python; keep them off the event loop
+        customers = await asyncio.to_thread(
+            data_loader.search_customers,
             name=filter.name,
             state=filter.state,
             transcript_text=filter.transcript_text,
             limit=filter.limit,
             offset=filter.offset
         )
-        return [CustomerType.from_model(c, include_transcripts=filter.include_transcripts) for c in customers]
+        if not filter.include_transcripts:
+            return [CustomerType.from_model(c) for c in customers]
+
+        preloaded = await _transcripts_for_customers(info, [c.customer_id for c in customers])
+        return [
+            CustomerType.from_model(c, include_transcripts=True, transcripts=preloaded[c.customer_id])
+            for c in customers
+        ]
 
     @strawberry.field
     async def get_transcript(self, call_id: str) -> Optional[CallTranscriptType]:
@@ -189,7 +264,8 @@ class DataQuery:
         self,
         filter: TranscriptFilterInput
     ) -> List[CallTranscriptType]:
-        transcripts = data_loader.search_transcripts(
+        transcripts = await asyncio.to_thread(
+            data_loader.search_transcripts,
             customer_id=filter.customer_id,
             agent_id=filter.agent_id,
             start_date=filter.start_date,
@@ -200,7 +276,11 @@ class DataQuery:
         return [CallTranscriptType.from_model(t) for t in transcripts]
 
     @strawberry.field
-    async def get_customers_with_transcripts(self) -> List[CustomerType]:
+    async def get_customers_with_transcripts(self, info: Info) -> List[CustomerType]:
         """Get all customers that have at least one transcript."""
-        customers = data_loader.get_customers_with_transcripts()
-        return [CustomerType.from_model(c, include_transcripts=True) for c in customers]
+        customers = await asyncio.to_thread(data_loader.get_customers_with_transcripts)
+        preloaded = await _transcripts_for_customers(info, [c.customer_id for c in customers])
+        return [
+            CustomerType.from_model(c, include_transcripts=True, transcripts=preloaded[c.customer_id])
+            for c in customers
+        ]
@@ -0,0 +1,39 @@
+"""Request-scoped DataLoaders for the GraphQL data resolvers.
+
+Each request gets fresh loaders, so batching and caching only ever span a
+single GraphQL operation.
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+from strawberry.dataloader import DataLoader
+
+from app.data.data_loader import CallTranscript, Customer, DataLoader as SampleDataLoader, data_loader
+
+
+def create_customer_loader(source: SampleDataLoader = data_loader) -> DataLoader[str, Optional[Customer]]:
+    """Create a loader that batches customer lookups by ID."""
+    async def batch_customers(ids: List[str]) -> List[Optional[Customer]]:
+        customers = await asyncio.to_thread(source.get_customers)
+        return [customers.get(customer_id) for customer_id in ids]
+
+    return DataLoader(load_fn=batch_customers)
+
+
+def create_transcripts_by_customer_loader(
+    source: SampleDataLoader = data_loader
+) -> DataLoader[str, List[CallTranscript]]:
+    """Create a loader that batches transcript lookups by customer ID."""
+    async def batch_transcripts(ids: List[str]) -> List[List[CallTranscript]]:
+        by_customer = await asyncio.to_thread(source.get_transcripts_for_customers, ids)
+        return [by_customer[customer_id] for customer_id in ids]
+
+    return DataLoader(load_fn=batch_transcripts)
+
+
+def create_loaders(source: SampleDataLoader = data_loader) -> Dict[str, DataLoader]:
+    """Create the full set of loaders for one request."""
+    return {
+        "customer": create_customer_loader(source),
+        "transcripts_by_customer": create_transcripts_by_customer_loader(source),
+    }
@@ -0,0 +1,137 @@
+"""Persisted query support for the GraphQL endpoint.
+
+Clients may send ``extensions.persistedQuery.sha256Hash`` instead of the full
+query text, following the Apollo automatic persisted queries (APQ) protocol.
+Known queries can also be registered up front via ``POST /graphql/persist``.
+
+A hash miss or mismatch is reported as a GraphQL error (HTTP 200) with an
+``extensions.code``, as APQ clients expect; a bare HTTP 400 would make them
+treat persisted queries as unsupported and never send the query text.
+"""
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Optional, Union
+
+from graphql import GraphQLError, parse, validate
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.types import ExecutionResult
+
+
+def query_hash(query: str) -> str:
+    """Return the APQ hash (hex SHA-256) of a query string."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryStore:
+    """Bounded, thread-safe map from query hash to query text."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._queries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def get(self, sha256_hash: str) -> Optional[str]:
+        """Look up a query by hash, marking it as recently used."""
+        with self._lock:
+            query = self._queries.get(sha256_hash)
+            if query is not None:
+                self._queries.move_to_end(sha256_hash)
+            return query
+
+    def add(self, query: str) -> str:
+        """Store a query and return its hash."""
+        sha256_hash = query_hash(query)
+        with self._lock:
+            self._queries[sha256_hash] = query
+            self._queries.move_to_end(sha256_hash)
+            while len(self._queries) > self.maxsize:
+                self._queries.popitem(last=False)
+        return sha256_hash
+
+
+persisted_queries = PersistedQueryStore()
+
+
+def register_query(schema, query: str) -> str:
+    """Validate a query against the schema and persist it.
+
+    Args:
+        schema: The strawberry schema the query will run against
+        query: The GraphQL query text
+
+    Returns:
+        The query's hash
+
+    Raises:
+        ValueError: If the query does not parse or validate
+    """
+    try:
+        document = parse(query)
+    except GraphQLError as e:
+        raise ValueError(e.message) from e
+
+    errors = validate(schema._schema, document)
+    if errors:
+        raise ValueError("; ".join(error.message for error in errors))
+
+    return persisted_queries.add(query)
+
+
+class _PersistedQueryFailure(GraphQLRequestData):
+    """Request data whose persisted query could not be resolved."""
+
+    def __init__(self, data: GraphQLRequestData, message: str, code: str):
+        super().__init__(
+            query=None,
+            variables=data.variables,
+            operation_name=data.operation_name,
+            extensions=data.extensions,
+        )
+        self.error = GraphQLError(message, extensions={"code": code})
+
+
+class PersistedQueryRouter(GraphQLRouter):
+    """GraphQLRouter that resolves APQ hashes to stored query text."""
+
+    async def parse_http_body(self, request) -> Union[GraphQLRequestData, List[GraphQLRequestData]]:
+        data = await super().parse_http_body(request)
+        if isinstance(data, list):
+            return [self._resolve_persisted(item) for item in data]
+        return self._resolve_persisted(data)
+
+    async def execute_single(self, request, request_adapter, sub_response, context, root_value,
+                             request_data: GraphQLRequestData) -> ExecutionResult:
+        if isinstance(request_data, _PersistedQueryFailure):
+            return ExecutionResult(data=None, errors=[request_data.error])
+        return await super().execute_single(
+            request=request,
+            request_adapter=request_adapter,
+            sub_response=sub_response,
+            context=context,
+            root_value=root_value,
+            request_data=request_data,
+        )
+
+    @staticmethod
+    def _resolve_persisted(data: GraphQLRequestData) -> GraphQLRequestData:
+        persisted = (data.extensions or {}).get("persistedQuery")
+        if not isinstance(persisted, dict) or "sha256Hash" not in persisted:
+            return data
+
+        sha256_hash = persisted["sha256Hash"]
+        if data.query is None:
+            query = persisted_queries.get(sha256_hash)
+            if query is None:
+                return _PersistedQueryFailure(data, "PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            data.query = query
+        elif query_hash(data.query) != sha256_hash:
+            return _PersistedQueryFailure(data, "provided sha does not match query", "BAD_REQUEST")
+        else:
+            persisted_queries.add(data.query)
+
+        return data
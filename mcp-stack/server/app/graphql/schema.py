@@ -1,23 +1,34 @@
 """GraphQL schema definition for the MCP Server."""
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.fastapi import BaseContext
 from strawberry.types import Info as _Info
 from strawberry.types.info import RootValueType
 
 # Import data-related types and queries
 from .data_types import DataQuery as DataQueryType, CustomerType, CallTranscriptType
+from .loaders import create_loaders
+from app.data.data_loader import data_loader
 
 # Context type for GraphQL resolvers
 class GraphQLContext(BaseContext):
-    """Custom context for GraphQL resolvers."""
+    """Custom context for GraphQL resolvers.
+
+    Process-wide state lives on the class and is shared by every request;
+    only the DataLoaders are built per request.
+    """
+    # Shared sample data source, looked up on the class rather than copied per request
+    data_source = data_loader
+
     def __init__(self):
+        # BaseContext sets request, background_tasks and response
         super().__init__()
-        # You can add custom context properties here
-        self.request = None
-        self.response = None
+        # Fresh per request so batching/caching never leaks across requests
+        self.loaders = create_loaders(self.data_source)
 
 # Custom Info type that uses our custom Context
 Info = _Info[GraphQLContext, RootValueType]
@@ -91,119 +102,123 @@ class HealthCheckType:
     timestamp: str
     version: str = "1.0.0"
 
-@strawberry.type
-class Query:
-    """Root query type."""
-    @strawberry.field
-    async def health(self, info: Info) -> HealthCheckType:
-        """Health check endpoint."""
-        return HealthCheckType(
-            status="ok",
-            timestamp=datetime.now().isoformat()
-        )
+# Lightweight rows for the hot health/list_tools resolvers. Strawberry reads
+# fields with getattr, so these resolve as HealthCheckType/ToolType without
+# the per-instance __dict__ of the dataclass-based types.
+class _ToolRow(NamedTuple):
+    id: str
+    name: str
+    description: str
+    category: str
+    is_available: bool
+    created_at: str
+    updated_at: str
 
-    @strawberry.field
-    async def list_tools(
-        self,
-        info: Info,
-        category: Optional[str] = None,
-        available_only: bool = True,
-        limit: int = 10,
-        offset: int = 0
-    ) -> List[ToolType]:
-        """
-        List all available tools with optional filtering.
-
-        Args:
-            category: Filter tools by category
-            available_only: Only return tools that are currently available
-            limit: Maximum number of tools to return
-            offset: Number of tools to skip for pagination
-
-        Returns:
-            List of ToolType objects
-        """
-        # TODO: Implement actual data fetching from your data source
-        # This is a mock implementation
-        mock_tools = [
-            ToolType(
-                id="1",
-                name="text-generator",
-                description="Generates text based on input",
-                category="generation",
-                is_available=True,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat()
-            ),
-            ToolType(
-                id="2",
-                name="image-classifier",
-                description="Classifies images into categories",
-                category="vision",
-                is_available=True,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat()
-            )
-        ]
-
-        # Apply filters
-        filtered_tools = [
-            tool for tool in mock_tools
-            if (not available_only or tool.is_available) and
-               (not category or tool.category == category)
-        ]
-
-        # Apply pagination
-        return filtered_tools[offset:offset + limit]
+class _HealthRow(NamedTuple):
+    status: str
+    timestamp: str
+    version: str = "1.0.0"
 
-    @strawberry.field
-    async def get_model(self, info: Info, id: str) -> Optional[ModelType]:
-        """Get a model by ID."""
-        # TODO: Implement actual data fetching
-        return None
+# Timestamp of the mock data, fixed at import time
+_NOW = datetime.now().isoformat()
 
-    @strawberry.field
-    async def list_models(
-        self,
-        info: Info,
-        limit: int = 10,
-        offset: int = 0,
-    ) -> List[ModelType]:
-        """List all models with pagination."""
-        # TODO: Implement actual data fetching
-        return []
+# TODO: Replace with actual data fetching from your data source
+_MOCK_TOOLS = (
+    _ToolRow(
+        id="1",
+        name="text-generator",
+        description="Generates text based on input",
+        category="generation",
+        is_available=True,
+        created_at=_NOW,
+        updated_at=_NOW
+    ),
+    _ToolRow(
+        id="2",
+        name="image-classifier",
+        description="Classifies images into categories",
+        category="vision",
+        is_available=True,
+        created_at=_NOW,
+        updated_at=_NOW
+    ),
+)
 
-    @strawberry.field
-    async def get_context(self, info: Info, id: str) -> Optional[ContextType]:
-        """Get a context by ID."""
-        # TODO: Implement actual data fetching
-        return None
+def _build_tool_buckets(tools):
+    """Pre-filter tools for every (category, available_only) combination.
 
-    @strawberry.field
-    async def get_prediction(self, info: Info, id: str) -> Optional[PredictionType]:
-        """Get a prediction by ID."""
-        # TODO: Implement actual data fetching
-        return None
+    The None category holds all tools; lists keep the source order.
+    """
+    buckets: Dict[tuple, List[_ToolRow]] = {}
+    for tool in tools:
+        for category in (None, tool.category):
+            buckets.setdefault((category, False), []).append(tool)
+            if tool.is_available:
+                buckets.setdefault((category, True), []).append(tool)
+    return buckets
+
+_TOOL_BUCKETS = _build_tool_buckets(_MOCK_TOOLS)
+
+# (millisecond tick, ISO timestamp) of the last _now_iso() call
+_iso_cache = (-1, "")
+
+def _now_iso() -> str:
+    """Return the current time as ISO string, formatted at most once per millisecond."""
+    global _iso_cache
+    tick = int(time.monotonic() * 1000)
+    if tick != _iso_cache[0]:
+        _iso_cache = (tick, datetime.now().isoformat())
+    return _iso_cache[1]
+
+def _health() -> _HealthRow:
+    """Build the health check response."""
+    return _HealthRow(
+        status="ok",
+        timestamp=_now_iso()
+    )
+
+def _list_tools(
+    category: Optional[str] = None,
+    available_only: bool = True,
+    limit: int = 10,
+    offset: int = 0
+) -> List[_ToolRow]:
+    """
+    List all available tools with optional filtering.
+
+    Args:
+        category: Filter tools by category
+        available_only: Only return tools that are currently available
+        limit: Maximum number of tools to return
+        offset: Number of tools to skip for pagination
+
+    Returns:
+        List of tool rows, resolved as ToolType
+    """
+    # Filters map straight to a prebuilt bucket; only pagination is left
+    bucket = _TOOL_BUCKETS.get((category or None, available_only), [])
+    return bucket[offset:offset + limit]
 
 # --- Mutation ---
 @strawberry.type
 class Mutation:
     """Root mutation type."""
     @strawberry.mutation
-    async def create_model(self, info: Info, input: ModelInput) -> ModelType:
+    def create_model(self, info: Info, input: ModelInput) -> ModelType:
         """Create a new model."""
         # TODO: Implement actual creation
+        now = _now_iso()
         return ModelType(
             id="1",
             name=input.name,
             description=input.description,
             version=input.version,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
+            created_at=now,
+            updated_at=now
         )
 
     @strawberry.mutation
-    async def create_prediction(self, info: Info, input: PredictionInput) -> PredictionType:
+    def create_prediction(self, info: Info, input: PredictionInput) -> PredictionType:
         """Create a new prediction."""
         # TODO: Implement actual prediction
         return PredictionType(
@@ -211,7 +226,7 @@ class Mutation:
             model_id=input.model_id,
             input_data=input.input_data,
             output_data="{\"result\": \"sample_output\"}",
-            created_at=datetime.now().isoformat()
+            created_at=_now_iso()
         )
 
 # Main Query class that combines all query types
@@ -219,15 +234,12 @@ class Mutation:
 class Query(DataQueryType):
     """Root query type."""
     @strawberry.field
-    async def health(self, info: Info) -> HealthCheckType:
+    def health(self, info: Info) -> HealthCheckType:
         """Health check endpoint."""
-        return HealthCheckType(
-            status="ok",
-            timestamp=datetime.now().isoformat()
-        )
+        return _health()
 
     @strawberry.field
-    async def list_tools(
+    def list_tools(
         self,
         info: Info,
         category: Optional[str] = None,
@@ -236,44 +248,33 @@ class Query(DataQueryType):
         offset: int = 0
     ) -> List[ToolType]:
         """List all available tools with optional filtering."""
-        # This is a mock implementation
-        mock_tools = [
-            ToolType(
-                id="1",
-                name="text-generator",
-                description="Generates text based on input",
-                category="generation",
-                is_available=True,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat()
-            ),
-            ToolType(
-                id="2",
-                name="image-classifier",
-                description="Classifies images into categories",
-                category="vision",
-                is_available=True,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat()
-            )
-        ]
-
-        # Apply filters
-        if category:
-            mock_tools = [t for t in mock_tools if t.category == category]
-        if available_only:
-            mock_tools = [t for t in mock_tools if t.is_available]
-
-        # Apply pagination
-        return mock_tools[offset:offset + limit]
+        return _list_tools(category, available_only, limit, offset)
 
 # Create the schema
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
-    types=[CustomerType, CallTranscriptType]  # Register custom types
+    types=[CustomerType, CallTranscriptType],  # Register custom types
+    # Clients send the same few documents over and over, so cache parsing
+    # and validation results instead of redoing them for every request
+    extensions=[
+        ParserCache(maxsize=1024),
+        ValidationCache(maxsize=1024),
+    ]
 )
 
+# Operations run once at startup so the first real request does not pay for
+# graphql-core's lazily built lookup tables and the execution context setup
+_WARMUP_QUERIES = (
+    "{ __typename }",
+    "{ __schema { queryType { name } types { name fields { name } } } }",
+)
+
+def warm_schema() -> None:
+    """Execute a few trivial operations to warm the schema's caches."""
+    for query in _WARMUP_QUERIES:
+        schema.execute_sync(query)
+
 def get_context() -> GraphQLContext:
     """Get the GraphQL context."""
     return GraphQLContext()
@@ -1,10 +1,14 @@
 """MCP Server entry point."""
 import os
 import sys
+import time
+import asyncio
+import inspect
 import logging
-from typing import Any, Dict, Optional, List
+import orjson
+from typing import Any, Awaitable, Callable, Dict, Optional, List
 from fastapi import FastAPI, HTTPException, Request, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
@@ -20,7 +24,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="MCP Server",
     version="0.1.0",
-    description="MCP Server with data services"
+    description="MCP Server with data services",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -32,142 +37,229 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Import MCP app after FastAPI app is created to avoid circular imports
+# Import MCP app and data modules after FastAPI app is created to avoid circular imports
 from app.mcp_server import create_app, MCPConfig
+from app.data.data_loader import data_loader, Customer
+from app.data.nltk_setup import ensure_nltk_ready
+from app.graphql.schema import schema, get_context, warm_schema
+from app.graphql.persisted import PersistedQueryRouter, register_query
+
+# Create the MCP app; the routes below and the /mcp mount share this instance
+mcp_app = create_app()
+logger.info(f"MCP app type: {type(mcp_app)}")
+
+# Public attributes of the MCP app, for diagnostics; dir() is too costly per request
+_MCP_PUBLIC_ATTRS = tuple(attr for attr in dir(mcp_app) if not attr.startswith('_'))
+
+class PersistQueryRequest(BaseModel):
+    """Request body for persisting a GraphQL query."""
+    query: str
+
+# The health payload never changes at runtime, so encode it once
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "version": app.version})
+_HEALTH_RESPONSE = Response(content=_HEALTH_BYTES, media_type="application/json")
+
+# pydantic-core serializer for customers, so responses are encoded to JSON in one step
+_CUSTOMER_SERIALIZER = Customer.__pydantic_serializer__
+
+def _serialize_tool(tool: Any) -> Dict[str, Any]:
+    """Convert an MCP tool (Tool object or plain function) to a JSON-friendly dict."""
+    return {"name": getattr(tool, "name", None) or getattr(tool, "__name__", str(tool)),
+            "description": getattr(tool, "description", None) or getattr(tool, "__doc__", "")}
+
+def _resolve_tools_fetcher(mcp: Any) -> Callable[[], Awaitable[Dict[str, Any]]]:
+    """Work out once how to list tools on this MCP app and return a fetcher for it."""
+    if hasattr(mcp, 'get_tools'):
+        async def fetch_tools() -> Dict[str, Any]:
+            tools = mcp.get_tools()
+            if inspect.isawaitable(tools):
+                tools = await tools
+
+            # FastMCP returns a name -> Tool mapping; handle other shapes too
+            if isinstance(tools, dict):
+                tools = list(tools.values())
+            elif hasattr(tools, '__aiter__'):
+                tools = [t async for t in tools]
+            elif not isinstance(tools, (list, tuple)):
+                tools = list(tools) if hasattr(tools, '__iter__') else [tools]
+
+            return {"tools": [_serialize_tool(t) for t in tools]}
+        return fetch_tools
+
+    if hasattr(mcp, 'tools') and isinstance(mcp.tools, (list, tuple)):
+        async def fetch_static_tools() -> Dict[str, Any]:
+            return {"tools": [_serialize_tool(t) for t in mcp.tools]}
+        return fetch_static_tools
+
+    error = {"error": "No tools found. Available attributes:",
+             "attributes": list(_MCP_PUBLIC_ATTRS)}
+    async def no_tools() -> Dict[str, Any]:
+        return error
+    return no_tools
+
+def _resolve_prompts_fetcher(mcp: Any) -> Callable[[], Awaitable[Dict[str, Any]]]:
+    """Work out once how to list prompts on this MCP app and return a fetcher for it."""
+    if hasattr(mcp, 'list_mcp_prompts'):
+        return mcp.list_mcp_prompts
+
+    if hasattr(mcp, 'prompts'):
+        async def fetch_prompts() -> Dict[str, Any]:
+            return {"prompts": mcp.prompts}
+        return fetch_prompts
+
+    error = {"error": "No prompts found. Available methods:",
+             "available_methods": list(_MCP_PUBLIC_ATTRS)}
+    async def no_prompts() -> Dict[str, Any]:
+        return error
+    return no_prompts
+
+_tools_fetcher = _resolve_tools_fetcher(mcp_app)
+_prompts_fetcher = _resolve_prompts_fetcher(mcp_app)
+
+# The MCP app does not change after startup, so listings are only refreshed
+# every few seconds instead of being rebuilt for every request
+_LISTING_TTL_SECONDS = 30.0
+_listing_cache: Dict[str, tuple] = {}
+
+async def _cached_payload(key: str, fetcher: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Return the cached listing for key, refreshing it once its TTL has expired."""
+    cached = _listing_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    payload = await fetcher()
+    _listing_cache[key] = (now + _LISTING_TTL_SECONDS, payload)
+    return payload
 
 def configure_app() -> None:
     """Configure the FastAPI application with routes and middleware."""
+    # Download any missing NLTK data once at startup instead of on import
+    @app.on_event("startup")
+    async def prepare_nltk_data() -> None:
+        """Make sure the NLTK data used for transcript analysis is present."""
+        await asyncio.to_thread(ensure_nltk_ready)
+
+    # Build the GraphQL executor's caches before the first request arrives
+    @app.on_event("startup")
+    async def warm_graphql_schema() -> None:
+        """Run throwaway GraphQL operations so cold requests stay fast."""
+        await asyncio.to_thread(warm_schema)
+
     # Health check endpoint
     @app.get("/health")
-    async def health_check() -> Dict[str, str]:
+    async def health_check() -> Response:
         """Health check endpoint."""
-        return {"status": "healthy", "version": "0.1.0"}
+        return _HEALTH_RESPONSE
 
     # List MCP prompts endpoint
-@app.get("/mcp/prompts")
-async def list_mcp_prompts() -> Dict[str, Any]:
-    """List all available MCP prompts."""
-    try:
-        # Use the list_mcp_prompts function from the MCP app
-        if hasattr(mcp_app, 'list_mcp_prompts'):
-            result = await mcp_app.list_mcp_prompts()
-            return result
-        # Fallback to direct prompts attribute if available
-        elif hasattr(mcp_app, 'prompts'):
-            return {"prompts": mcp_app.prompts}
-        else:
-            return {"error": "No prompts found. Available methods:",
-                   "available_methods": [m for m in dir(mcp_app) if not m.startswith('_')]}
-    except Exception as e:
-        logger.error(f"Error listing MCP prompts: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    @app.get("/mcp/prompts")
+    async def list_mcp_prompts() -> Dict[str, Any]:
+        """List all available MCP prompts."""
+        try:
+            return await _cached_payload("prompts", _prompts_fetcher)
+        except Exception as e:
+            logger.error(f"Error listing MCP prompts: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=500, detail=str(e))
+
     # List MCP tools endpoint
     @app.get("/mcp/tools")
     async def list_mcp_tools() -> Dict[str, Any]:
         """List all available MCP tools."""
         try:
-            if hasattr(mcp_app, 'get_tools'):
-                # Await the coroutine if it's a coroutine function
-                tools_coro = mcp_app.get_tools()
-                if hasattr(tools_coro, '__await__'):
-                    tools = await tools_coro
-                else:
-                    tools = tools_coro
-
-                # Handle both sync and async tool lists
-                if hasattr(tools, '__aiter__'):
-                    tools = [t async for t in tools]
-                elif not isinstance(tools, (list, tuple)):
-                    tools = list(tools) if hasattr(tools, '__iter__') else [tools]
-
-                return {"tools": [{"name": getattr(t, "__name__", str(t)),
-                                "description": getattr(t, "__doc__", "")}
-                               for t in tools]}
-            elif hasattr(mcp_app, 'tools') and isinstance(mcp_app.tools, (list, tuple)):
-                return {"tools": [{"name": getattr(t, "__name__", str(t)),
-                                "description": getattr(t, "__doc__", "")}
-                               for t in mcp_app.tools]}
-            else:
-                return {"error": "No tools found. Available attributes:",
-                       "attributes": [attr for attr in dir(mcp_app) if not attr.startswith('_')]}
+            return await _cached_payload("tools", _tools_fetcher)
         except Exception as e:
             logger.error(f"Error listing MCP tools: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))
 
+    # Customer details endpoint
+    @app.get("/api/customers/{customer_id}", response_model=Customer)
+    async def get_customer_endpoint(customer_id: str = Path(..., description="The ID of the customer to retrieve")):
+        """
+        Get customer details by ID.
+
+        Args:
+            customer_id: The ID of the customer to retrieve
+
+        Returns:
+            The customer's information as JSON
+        """
+        try:
+            customer = data_loader.get_customer(customer_id)
+            if customer:
+                return Response(
+                    content=_CUSTOMER_SERIALIZER.to_json(customer),
+                    media_type="application/json"
+                )
+            else:
+                raise HTTPException(status_code=404, detail=f"Customer with ID {customer_id} not found")
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error retrieving customer {customer_id}: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    # Test endpoint to verify MCP app mounting
+    @app.get("/mcp/test")
+    async def test_mcp():
+        return {
+            "message": "MCP endpoint is working",
+            "mcp_app_type": str(type(mcp_app)),
+            "has_get_prompts": hasattr(mcp_app, 'get_prompts'),
+            "has_prompts_attr": hasattr(mcp_app, 'prompts')
+        }
+
     # Add exception handlers
     @app.exception_handler(HTTPException)
-    async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+    async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
         """Handle HTTP exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={"detail": exc.detail},
         )
 
-# Import data_loader after FastAPI app is created to avoid circular imports
-from app.data.data_loader import data_loader, Customer
-
-# Initialize the app configuration
-configure_app()
+    # Register a query so clients can send just its hash (APQ)
+    @app.post("/graphql/persist")
+    async def persist_graphql_query(payload: PersistQueryRequest) -> Dict[str, str]:
+        """Validate and persist a GraphQL query, returning its SHA-256 hash."""
+        try:
+            return {"sha256Hash": register_query(schema, payload.query)}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-# Customer details endpoint
-@app.get("/api/customers/{customer_id}", response_model=Dict[str, Any])
-async def get_customer_endpoint(customer_id: str = Path(..., description="The ID of the customer to retrieve")):
-    """
-    Get customer details by ID.
+    # GraphQL endpoint; get_context builds fresh DataLoaders for every request
+    graphql_app = PersistedQueryRouter(schema, context_getter=get_context)
+    app.include_router(graphql_app, prefix="/graphql")
 
-    Args:
-        customer_id: The ID of the customer to retrieve
+    # Mount the MCP app last so the /mcp/* routes above take precedence
+    mount_mcp_app()
 
-    Returns:
-        A dictionary containing the customer's information
-    """
+def mount_mcp_app() -> None:
+    """Mount the MCP app at /mcp using its http_app method."""
     try:
-        customer = data_loader.get_customer(customer_id)
-        if customer:
-            return customer.dict()
-        else:
-            raise HTTPException(status_code=404, detail=f"Customer with ID {customer_id} not found")
+        # Get the ASGI app from FastMCP
+        mcp_asgi_app = mcp_app.http_app()
+        # Mount it at /mcp
+        app.mount("/mcp", mcp_asgi_app)
+        logger.info("Mounted MCP app at /mcp")
     except Exception as e:
-        logger.error(f"Error retrieving customer {customer_id}: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
-
-# Test endpoint to verify MCP app mounting
-@app.get("/mcp/test")
-async def test_mcp():
-    return {
-        "message": "MCP endpoint is working",
-        "mcp_app_type": str(type(mcp_app)) if 'mcp_app' in globals() else "mcp_app not found",
-        "has_get_prompts": hasattr(mcp_app, 'get_prompts') if 'mcp_app' in globals() else False,
-        "has_prompts_attr": hasattr(mcp_app, 'prompts') if 'mcp_app' in globals() else False
-    }
-
-# Create and configure the MCP app
-mcp_app = create_app()
-logger.info(f"MCP app type: {type(mcp_app)}")
-
-# Mount the MCP app using its http_app method
-try:
-    # Get the ASGI app from FastMCP
-    mcp_asgi_app = mcp_app.http_app()
-    # Mount it at /mcp
-    app.mount("/mcp", mcp_asgi_app)
-    logger.info("Mounted MCP app at /mcp")
-except Exception as e:
-    logger.error(f"Failed to mount MCP app: {str(e)}", exc_info=True)
-    # Fall back to the existing mounting logic if http_app fails
-    if hasattr(mcp_app, 'router'):
-        app.include_router(mcp_app.router, prefix="/mcp")
-        logger.info("Mounted MCP router at /mcp")
-    elif hasattr(mcp_app, 'app') and isinstance(mcp_app.app, FastAPI):
-        app.mount("/mcp", mcp_app.app)
-        logger.info("Mounted MCP FastAPI app at /mcp")
-    else:
-        logger.warning("No MCP routes mounted. Available attributes on mcp_app:")
-        for attr in dir(mcp_app):
-            if not attr.startswith('_'):
+        logger.error(f"Failed to mount MCP app: {str(e)}", exc_info=True)
+        # Fall back to the existing mounting logic if http_app fails
+        if hasattr(mcp_app, 'router'):
+            app.include_router(mcp_app.router, prefix="/mcp")
+            logger.info("Mounted MCP router at /mcp")
+        elif hasattr(mcp_app, 'app') and isinstance(mcp_app.app, FastAPI):
+            app.mount("/mcp", mcp_app.app)
+            logger.info("Mounted MCP FastAPI app at /mcp")
+        else:
+            logger.warning("No MCP routes mounted. Available attributes on mcp_app:")
+            for attr in _MCP_PUBLIC_ATTRS:
                 attr_type = type(getattr(mcp_app, attr))
                 logger.warning(f"- {attr}: {attr_type}")
 
+# Initialize the app configuration
+configure_app()
+
 def run_server(host: str = "0.0.0.0", port: int = 8005, reload: bool = False):
     """Run the server using uvicorn."""
     import uvicorn
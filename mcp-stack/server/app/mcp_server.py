@@ -1,10 +1,13 @@
 """MCP Server implementation using FastMCP."""
 import os
 import sys
+import time
+import hashlib
 import logging
 import asyncio
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from fastmcp import FastMCP, Context
 from pydantic import BaseModel, Field, validator
@@ -27,6 +30,44 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 if GEMINI_API_KEY:
     genai.configure(api_key=GEMINI_API_KEY)
 
+# Gemini model clients by name, created on first use and reused across calls
+_MODEL_CACHE: Dict[str, genai.GenerativeModel] = {}
+
+def _get_gemini_model(model_name: str) -> genai.GenerativeModel:
+    """Return the shared GenerativeModel for a model name."""
+    model = _MODEL_CACHE.get(model_name)
+    if model is None:
+        model = _MODEL_CACHE.setdefault(model_name, genai.GenerativeModel(model_name))
+    return model
+
+# Recent Gemini responses, keyed by a hash of model, temperature and prompt
+_GENERATION_CACHE_SIZE = 1000
+_GENERATION_CACHE_TTL_SECONDS = 300.0
+_generation_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+def _generation_key(model_name: str, temperature: float, prompt: str) -> str:
+    """Return the response cache key for a generation request."""
+    return hashlib.sha256(f"{model_name}|{temperature}|{prompt}".encode("utf-8")).hexdigest()
+
+def _get_cached_generation(key: str) -> Optional[str]:
+    """Return a cached response if it is still fresh."""
+    entry = _generation_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, text = entry
+    if time.monotonic() - stored_at > _GENERATION_CACHE_TTL_SECONDS:
+        del _generation_cache[key]
+        return None
+    _generation_cache.move_to_end(key)
+    return text
+
+def _cache_generation(key: str, text: str) -> None:
+    """Store a response, evicting the least recently used ones past the size limit."""
+    _generation_cache[key] = (time.monotonic(), text)
+    _generation_cache.move_to_end(key)
+    while len(_generation_cache) > _GENERATION_CACHE_SIZE:
+        _generation_cache.popitem(last=False)
+
 class MCPConfig(BaseModel):
     """Configuration for the MCP server."""
     host: str = "0.0.0.0"
@@ -88,18 +129,25 @@ async def gemini_generate(prompt: str, model: str = "gemini-1.5-flash", temperat
     """
     if not GEMINI_API_KEY:
         raise ValueError("Gemini API key not configured. Set GEMINI_API_KEY environment variable.")
+    # Identical recent requests are answered without calling the API
+    cache_key = _generation_key(model, temperature, prompt)
+    cached = _get_cached_generation(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        # Initialize the model
-        model = genai.GenerativeModel(model)
+        # Reuse the model client for this model name
+        model = _get_gemini_model(model)
 
-        # Generate content
-        response = model.generate_content(
+        # Generate content without blocking the event loop
+        response = await model.generate_content_async(
             prompt,
             generation_config={
                 "temperature": temperature,
                 "max_output_tokens": 2048,
             }
         )
+        _cache_generation(cache_key, response.text)
         return response.text
     except Exception as e:
         error_msg = f"Error generating content with Gemini: {str(e)}"
@@ -137,7 +185,7 @@ async def get_customer(customer_id: str) -> Dict[str, Any]:
     try:
         customer = data_loader.get_customer(customer_id)
         if customer:
-            return customer.dict()
+            return customer.model_dump()
         else:
             return {"error": f"Customer with ID {customer_id} not found"}
     except Exception as e:
@@ -188,109 +236,37 @@ async def search_customers(
         - offset: Current offset
     """
     try:
-        # Get base customer list
-        customers = data_loader.search_customers(
-            name=name or (query if not (email or phone or company) else None),
+        # Filtering, sorting and pagination all happen in the loader
+        page = data_loader.query_customers(
+            query=query,
+            name=name,
             email=email,
             phone=phone,
             state=state,
             city=city,
             company=company,
+            has_transcripts=has_transcripts,
+            min_transcripts=min_transcripts,
+            last_contact_days=last_contact_days,
+            sort_by=sort_by,
+            sort_order=sort_order,
             limit=limit,
             offset=offset
         )
 
-        # Convert to dicts and add additional data
-        customer_dicts = []
-        for customer in customers:
-            customer_data = customer.dict()
-
-            # Get transcripts for this customer
-            transcripts = data_loader.search_transcripts(customer_id=customer.customer_id)
-            transcript_count = len(transcripts)
+        results = []
+        for customer in page.items:
+            customer_data = customer.model_dump()
 
-            # Add transcript metadata
+            # Add transcript metadata, precomputed when transcripts are loaded
+            transcript_count, last_contact = data_loader.get_customer_transcript_stats(customer.customer_id)
             customer_data['transcript_count'] = transcript_count
-            customer_data['last_contact'] = (
-                max(t.call_timestamp for t in transcripts).isoformat()
-                if transcripts else None
-            )
-
-            # Calculate relevance score based on query match
-            relevance = 0
-            if query:
-                query = query.lower()
-                fields_to_search = [
-                    customer_data.get('personal_info', {}).get('first_name', '').lower(),
-                    customer_data.get('personal_info', {}).get('last_name', '').lower(),
-                    customer_data.get('personal_info', {}).get('email', '').lower(),
-                    customer_data.get('employment', {}).get('company', '').lower(),
-                    f"{customer_data.get('home_address', {}).get('city', '')}, {customer_data.get('home_address', {}).get('state', '')}".lower()
-                ]
-
-                # Simple relevance scoring
-                for field in fields_to_search:
-                    if query in field:
-                        relevance += 1
-                    if field.startswith(query):
-                        relevance += 2  # Higher score for prefix matches
-
-            customer_data['_relevance'] = relevance
-            customer_dicts.append(customer_data)
-
-        # Apply additional filters
-        filtered_customers = []
-        for customer in customer_dicts:
-            # Apply has_transcripts filter
-            if has_transcripts is not None:
-                has_transcripts_bool = customer['transcript_count'] > 0
-                if has_transcripts != has_transcripts_bool:
-                    continue
-
-            # Apply min_transcripts filter
-            if min_transcripts is not None and customer['transcript_count'] < min_transcripts:
-                continue
-
-            # Apply last_contact_days filter
-            if last_contact_days is not None and customer['last_contact']:
-                from datetime import datetime, timedelta
-                last_contact = datetime.fromisoformat(customer['last_contact'].replace('Z', '+00:00'))
-                if (datetime.now(last_contact.tzinfo) - last_contact).days > last_contact_days:
-                    continue
-
-            filtered_customers.append(customer)
-
-        # Sort results
-        reverse_sort = sort_order.lower() == 'desc'
-        if sort_by == 'relevance' and query:
-            filtered_customers.sort(key=lambda x: x['_relevance'], reverse=True)
-        elif sort_by == 'name':
-            filtered_customers.sort(
-                key=lambda x: f"{x.get('personal_info', {}).get('last_name', '')} "
-                            f"{x.get('personal_info', {}).get('first_name', '')}".lower(),
-                reverse=reverse_sort
-            )
-        elif sort_by == 'last_contact':
-            filtered_customers.sort(
-                key=lambda x: x.get('last_contact') or '',
-                reverse=reverse_sort
-            )
-        elif sort_by == 'transcript_count':
-            filtered_customers.sort(
-                key=lambda x: x.get('transcript_count', 0),
-                reverse=reverse_sort
-            )
-
-        # Apply pagination
-        paginated_results = filtered_customers[offset:offset + limit]
-
-        # Remove internal fields before returning
-        for customer in paginated_results:
-            customer.pop('_relevance', None)
+            customer_data['last_contact'] = last_contact
+            results.append(customer_data)
 
         return {
-            'results': paginated_results,
-            'total': len(filtered_customers),
+            'results': results,
+            'total': page.total,
             'limit': limit,
             'offset': offset
         }
@@ -322,9 +298,9 @@ async def get_customer_transcripts(customer_id: str) -> List[Dict[str, Any]]:
         if not customer:
             return [{"error": f"Customer with ID {customer_id} not found"}]
 
-        # Get all transcripts for this customer
-        transcripts = data_loader.search_transcripts(customer_id=customer_id)
-        return [t.dict() for t in transcripts]
+        # Get all transcripts for this customer from the per-customer index
+        transcripts = data_loader.get_transcripts_for_customers([customer_id])[customer_id]
+        return [t.model_dump() for t in transcripts]
     except Exception as e:
         logger.error(f"Error retrieving transcripts for customer {customer_id}: {str(e)}", exc_info=True)
         return [{"error": f"Error retrieving transcripts: {str(e)}"}]
@@ -388,166 +364,58 @@ async def search_transcripts(
         - aggregations: Summary statistics (counts by call type, sentiment, etc.)
     """
     try:
-        # First, get the base set of transcripts
-        transcripts = data_loader.search_transcripts(
+        # Filtering, sorting, pagination and aggregation all happen in the loader
+        page = data_loader.query_transcripts(
+            query=query,
             customer_id=customer_id,
+            customer_name=customer_name,
             agent_id=agent_id,
+            call_type=call_type,
             start_date=start_date,
             end_date=end_date,
+            min_duration=min_duration,
+            max_duration=max_duration,
+            min_sentiment=min_sentiment,
+            max_sentiment=max_sentiment,
+            has_context=has_context,
+            context=context,
+            is_ada_related=is_ada_related,
+            ada_violation_occurred=ada_violation_occurred,
+            sort_by=sort_by,
+            sort_order=sort_order,
             limit=limit,
             offset=offset
         )
 
-        # Convert to dicts and add additional data
-        transcript_dicts = []
-        call_types = set()
-        sentiment_scores = []
+        # Skip excluded fields while serializing rather than dropping them afterwards
+        excluded_fields = set()
+        if not include_summary:
+            excluded_fields.add('call_summary')
+        if not include_transcript:
+            excluded_fields.add('transcript')
 
-        for transcript in transcripts:
-            transcript_data = transcript.dict()
+        results = []
+        customer_data_by_id: Dict[str, Dict[str, Any]] = {}
+        for transcript in page.items:
+            transcript_data = transcript.model_dump(exclude=excluded_fields)
 
-            # Get customer data if needed
+            # Include customer data when searching by customer or text
             if customer_name or query:
-                customer = data_loader.get_customer(transcript.customer_id)
-                if customer:
-                    transcript_data['customer'] = customer.dict()
-
-            # Calculate relevance score if query is provided
-            relevance = 0
-            if query:
-                query = query.lower()
-
-                # Search in call summary
-                if 'call_summary' in transcript_data and transcript_data['call_summary']:
-                    summary = transcript_data['call_summary'].lower()
-                    if query in summary:
-                        relevance += summary.count(query) * 2  # More occurrences = higher score
-                        if summary.startswith(query):
-                            relevance += 5  # Bonus for prefix match in summary
-
-                # Search in transcript content if included
-                if include_transcript and 'transcript' in transcript_data:
-                    for entry in transcript_data['transcript']:
-                        if 'text' in entry and query in entry['text'].lower():
-                            relevance += 1
-
-            transcript_data['_relevance'] = relevance
-
-            # Track call types and sentiment for aggregations
-            call_type = transcript_data.get('call_type')
-            if call_type:
-                call_types.add(call_type)
-
-            sentiment = transcript_data.get('sentiment', {}).get('polarity', 0)
-            sentiment_scores.append(sentiment)
-
-            transcript_dicts.append(transcript_data)
-
-        # Apply additional filters
-        filtered_transcripts = []
-        for t in transcript_dicts:
-            # Apply call type filter
-            if call_type and t.get('call_type') != call_type:
-                continue
-
-            # Apply duration filters
-            duration = t.get('call_duration_seconds', 0)
-            if min_duration is not None and duration < min_duration:
-                continue
-            if max_duration is not None and duration > max_duration:
-                continue
-
-            # Apply sentiment filters
-            sentiment = t.get('sentiment', {}).get('polarity', 0)
-            if min_sentiment is not None and sentiment < min_sentiment:
-                continue
-            if max_sentiment is not None and sentiment > max_sentiment:
-                continue
-
-            # Apply context filters
-            contexts = t.get('contexts', [])
-            if has_context is not None:
-                has_contexts = bool(contexts)
-                if has_context != has_contexts:
-                    continue
-
-            if context and context.lower() not in [c.lower() for c in contexts]:
-                continue
-
-            # Apply ADA filters
-            if is_ada_related is not None and t.get('is_ada_related') != is_ada_related:
-                continue
-
-            if ada_violation_occurred is not None and t.get('ada_violation_occurred') != ada_violation_occurred:
-                continue
-
-            # Filter by customer name if provided
-            if customer_name and 'customer' in t:
-                customer = t['customer']
-                full_name = f"{customer.get('personal_info', {}).get('first_name', '')} {customer.get('personal_info', {}).get('last_name', '')}"
-                if customer_name.lower() not in full_name.lower():
-                    continue
-
-            filtered_transcripts.append(t)
-
-        # Sort results
-        reverse_sort = sort_order.lower() == 'desc'
-        if sort_by == 'date':
-            filtered_transcripts.sort(
-                key=lambda x: x.get('call_timestamp', ''),
-                reverse=reverse_sort
-            )
-        elif sort_by == 'duration':
-            filtered_transcripts.sort(
-                key=lambda x: x.get('call_duration_seconds', 0),
-                reverse=reverse_sort
-            )
-        elif sort_by == 'sentiment':
-            filtered_transcripts.sort(
-                key=lambda x: x.get('sentiment', {}).get('polarity', 0),
-                reverse=reverse_sort
-            )
-        elif sort_by == 'relevance' and query:
-            filtered_transcripts.sort(
-                key=lambda x: x.get('_relevance', 0),
-                reverse=True  # Always sort by relevance in descending order
-            )
-
-        # Apply pagination
-        paginated_results = filtered_transcripts[offset:offset + limit]
-
-        # Clean up the results
-        for t in paginated_results:
-            # Remove internal fields
-            t.pop('_relevance', None)
-
-            # Include/exclude fields based on parameters
-            if not include_summary and 'call_summary' in t:
-                t.pop('call_summary')
-
-            if not include_transcript and 'transcript' in t:
-                t.pop('transcript')
-
-        # Prepare aggregations
-        aggregations = {
-            'call_types': {t: sum(1 for x in filtered_transcripts if x.get('call_type') == t)
-                          for t in call_types},
-            'sentiment': {
-                'min': min(sentiment_scores) if sentiment_scores else None,
-                'max': max(sentiment_scores) if sentiment_scores else None,
-                'avg': sum(sentiment_scores)/len(sentiment_scores) if sentiment_scores else None,
-                'count': len(sentiment_scores)
-            },
-            'total_duration': sum(t.get('call_duration_seconds', 0) for t in filtered_transcripts),
-            'total_count': len(filtered_transcripts)
-        }
+                customer_id = transcript.customer_id
+                if customer_id not in customer_data_by_id:
+                    customer = data_loader.get_customer(customer_id)
+                    customer_data_by_id[customer_id] = customer.model_dump() if customer else None
+                if customer_data_by_id[customer_id] is not None:
+                    transcript_data['customer'] = customer_data_by_id[customer_id]
+
+            results.append(transcript_data)
 
         return {
-            'results': paginated_results,
-            'total': len(filtered_transcripts),
+            'results': results,
+            'total': page.total,
             'limit': limit,
             'offset': offset,
-            'aggregations': aggregations
+            'aggregations': page.aggregations
         }
 
     except Exception as e:
@@ -619,15 +487,25 @@ def create_app(config: Optional[MCPConfig] = None) -> FastMCP:
     async def list_mcp_prompts() -> Dict[str, Any]:
         """List all available MCP prompts and debug info."""
         try:
+            # Look up and classify every public attribute once
+            app_dir = dir(mcp_app)
+            attrs = {name: getattr(mcp_app, name) for name in app_dir if not name.startswith('_')}
+            callable_methods = {
+                name: attr.__doc__ or "No docstring"
+                for name, attr in attrs.items()
+                if callable(attr)
+            }
+
             debug_info = {
-                "available_methods": [m for m in dir(mcp_app) if callable(getattr(mcp_app, m)) and not m.startswith('_')],
-                "available_attributes": [a for a in dir(mcp_app) if not callable(getattr(mcp_app, a)) and not a.startswith('_')],
+                "available_methods": list(callable_methods),
+                "available_attributes": [name for name, attr in attrs.items() if not callable(attr)],
                 "prompts_found": False,
                 "prompts": {},
-                "has_get_prompts": hasattr(mcp_app, 'get_prompts'),
-                "has_prompts_attr": hasattr(mcp_app, 'prompts'),
+                "has_get_prompts": 'get_prompts' in callable_methods,
+                "has_prompts_attr": 'prompts' in attrs,
                 "app_type": str(type(mcp_app)),
-                "app_dir": dir(mcp_app)
+                "app_dir": app_dir,
+                "callable_methods": callable_methods
             }
 
             # Try to get prompts using get_prompts method if it exists
@@ -644,26 +522,8 @@ def create_app(config: Optional[MCPConfig] = None) -> FastMCP:
 
             # Fall back to prompts attribute if no prompts found yet
             if not debug_info["prompts_found"] and debug_info["has_prompts_attr"]:
-                debug_info["prompts"] = mcp_app.prompts
-                debug_info["prompts_found"] = bool(mcp_app.prompts)
-
-            # Check for get_prompts method
-            if hasattr(mcp_app, 'get_prompts'):
-                debug_info["available_methods"].append("get_prompts")
                 try:
-                    result = mcp_app.get_prompts()
-                    if hasattr(result, '__await__'):
-                        result = await result
-                    debug_info["prompts"] = result
-                    debug_info["prompts_found"] = bool(result)
-                except Exception as e:
-                    debug_info["get_prompts_error"] = str(e)
-
-            # Check for prompts attribute
-            if hasattr(mcp_app, 'prompts'):
-                debug_info["available_attributes"].append("prompts")
-                try:
-                    prompts = mcp_app.prompts
+                    prompts = attrs['prompts']
                     if hasattr(prompts, '__aiter__'):
                         prompts = [p async for p in prompts]
                     debug_info["prompts"] = prompts or []
@@ -671,37 +531,19 @@ def create_app(config: Optional[MCPConfig] = None) -> FastMCP:
                 except Exception as e:
                     debug_info["prompts_attribute_error"] = str(e)
 
-            # Check for add_prompt method (common in some MCP implementations)
-            if hasattr(mcp_app, 'add_prompt'):
-                debug_info["available_methods"].append("add_prompt")
-
-            # Include all callable methods and their docstrings
-            debug_info["callable_methods"] = {
-                name: getattr(mcp_app, name).__doc__ or "No docstring"
-                for name in dir(mcp_app)
-                if callable(getattr(mcp_app, name)) and not name.startswith('_')
-            }
-
             # If no prompts found, include all non-callable attributes
             if not debug_info["prompts_found"]:
                 debug_info["all_attributes"] = {
-                    name: str(type(getattr(mcp_app, name)))
-                    for name in dir(mcp_app)
-                    if not name.startswith('_') and not callable(getattr(mcp_app, name))
+                    name: str(type(attr))
+                    for name, attr in attrs.items()
+                    if not callable(attr)
                 }
 
             return debug_info
 
         except Exception as e:
             logger.error(f"Error in list_mcp_prompts: {str(e)}", exc_info=True)
-            raise HTTPException(
-                status_code=500,
-                detail={
-                    "error": str(e),
-                    "type": type(e).__name__,
-                    "available_methods": [m for m in dir(mcp_app) if callable(getattr(mcp_app, m)) and not m.startswith('_')]
-                }
-            )
+            raise
 
     # Register tools
     @mcp_app.tool()
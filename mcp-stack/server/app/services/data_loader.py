@@ -1,107 +1,255 @@
 """Data loading functionality for MCP."""
-import json
 import csv
+import fnmatch
+import hashlib
+import os
+import pickle
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-import pandas as pd
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 from loguru import logger
 
 from ..models.data_models import DataItem, DataSource, DataSourceType
 
+# ijson is optional; with it, large list-shaped JSON files are streamed one
+# record at a time instead of being parsed into memory at once
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_STREAM_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Parsed file contents are cached here when MCP_CACHE_DIR is set, so
+# unchanged files are not re-parsed across restarts. Caching is opt-in since
+# the entries are pickles and are loaded back as such.
+CACHE_DIR = Path(os.environ["MCP_CACHE_DIR"]) if os.getenv("MCP_CACHE_DIR") else None
+
+# Bump whenever the records a loader produces change (e.g. how empty CSV cells
+# are represented) so entries written by older code are not served
+_CACHE_FORMAT_VERSION = 1
+
+_EXT_MAP: Dict[str, DataSourceType] = {
+    '.json': DataSourceType.JSON,
+    '.csv': DataSourceType.CSV,
+    '.parquet': DataSourceType.PARQUET,
+    '.pq': DataSourceType.PARQUET,
+}
+
+@lru_cache(maxsize=4096)
+def _source_type_for(file_path: Union[str, Path]) -> DataSourceType:
+    """Map a file path to its source type, cached per path."""
+    ext = Path(file_path).suffix.lower()
+    try:
+        return _EXT_MAP[ext]
+    except KeyError:
+        raise ValueError(f"Unsupported file format: {ext}") from None
+
+def _expand_braces(pattern: str) -> List[str]:
+    """Expand shell-style brace groups, e.g. "*.{json,csv}" -> ["*.json", "*.csv"]."""
+    match = re.search(r"\{([^{}]*)\}", pattern)
+    if not match:
+        return [pattern]
+
+    head, tail = pattern[:match.start()], pattern[match.end():]
+    return [
+        expanded
+        for option in match.group(1).split(",")
+        for expanded in _expand_braces(head + option + tail)
+    ]
+
+def _iter_files(directory: str, recursive: bool) -> Iterator[os.DirEntry]:
+    """Yield the regular files under directory using os.scandir."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path, recursive)
+
 class DataLoader:
     """Loads data from various file formats."""
 
     @classmethod
     def detect_source_type(cls, file_path: Union[str, Path]) -> DataSourceType:
         """Detect the type of data source from file extension."""
-        path = Path(file_path)
-        ext = path.suffix.lower()
-
-        if ext == '.json':
-            return DataSourceType.JSON
-        elif ext == '.csv':
-            return DataSourceType.CSV
-        elif ext in ('.parquet', '.pq'):
-            return DataSourceType.PARQUET
-        else:
-            raise ValueError(f"Unsupported file format: {ext}")
+        return _source_type_for(file_path)
 
     @classmethod
-    def load_json_file(cls, file_path: Path) -> List[Dict[str, Any]]:
-        """Load data from a JSON file."""
+    def load_json_file(cls, file_path: Path) -> Iterable[Dict[str, Any]]:
+        """Load data from a JSON file.
+
+        Large top-level arrays are returned as a lazy record iterator when
+        ijson is installed.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                if ijson is not None and file_path.stat().st_size > _STREAM_THRESHOLD_BYTES:
+                    if f.read(64).lstrip().startswith(b'['):
+                        return cls._stream_json_array(file_path)
+                    f.seek(0)
+                data = orjson.loads(f.read())
                 if isinstance(data, list):
                     return data
                 return [data]
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error decoding JSON file {file_path}: {e}")
             raise
 
+    @staticmethod
+    def _stream_json_array(file_path: Path) -> Iterator[Dict[str, Any]]:
+        """Yield the records of a JSON array file one at a time."""
+        try:
+            with open(file_path, 'rb') as f:
+                yield from ijson.items(f, 'item', use_float=True)
+        except ijson.JSONError as e:
+            logger.error(f"Error streaming JSON file {file_path}: {e}")
+            raise
+
     @classmethod
     def load_csv_file(cls, file_path: Path) -> List[Dict[str, Any]]:
         """Load data from a CSV file."""
         try:
-            df = pd.read_csv(file_path)
-            return df.to_dict('records')
+            read_options = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+            convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+            table = pacsv.read_csv(file_path, read_options=read_options, convert_options=convert_options)
+
+            # Arrow infers dates and timestamps; keep them as the original text
+            temporal = [
+                field.name for field in table.schema
+                if pa.types.is_temporal(field.type)
+            ]
+            if temporal:
+                convert_options.column_types = {name: pa.string() for name in temporal}
+                table = pacsv.read_csv(file_path, read_options=read_options, convert_options=convert_options)
+
+            return table.to_pylist()
         except Exception as e:
             logger.error(f"Error loading CSV file {file_path}: {e}")
             raise
 
     @classmethod
-    def load_parquet_file(cls, file_path: Path) -> List[Dict[str, Any]]:
-        """Load data from a Parquet file."""
+    def load_parquet_file(cls, file_path: Path, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Load data from a Parquet file, optionally reading only some columns."""
         try:
-            df = pd.read_parquet(file_path)
-            return df.to_dict('records')
+            table = pq.read_table(
+                file_path,
+                columns=columns,
+                memory_map=True,
+                use_threads=True,
+                pre_buffer=True
+            )
+            return table.to_pylist()
         except Exception as e:
             logger.error(f"Error loading Parquet file {file_path}: {e}")
             raise
 
     @classmethod
-    def load_file(cls, file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    def load_file(cls, file_path: Union[str, Path]) -> Iterable[Dict[str, Any]]:
         """Load data from a file, automatically detecting the format."""
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
 
+        cache_path = None
+        if CACHE_DIR is not None:
+            stat = path.stat()
+            cache_path = cls._cache_path(path)
+            version = (_CACHE_FORMAT_VERSION, stat.st_mtime_ns, stat.st_size)
+            cached = cls._read_cache(cache_path, version)
+            if cached is not None:
+                return cached
+
         source_type = cls.detect_source_type(path)
 
         if source_type == DataSourceType.JSON:
-            return cls.load_json_file(path)
+            data = cls.load_json_file(path)
         elif source_type == DataSourceType.CSV:
-            return cls.load_csv_file(path)
+            data = cls.load_csv_file(path)
         elif source_type == DataSourceType.PARQUET:
-            return cls.load_parquet_file(path)
+            data = cls.load_parquet_file(path)
         else:
             raise ValueError(f"Unsupported file type: {source_type}")
 
+        # Streamed JSON arrays are left uncached; pickling them would
+        # materialize the whole file anyway
+        if cache_path is not None and isinstance(data, list):
+            cls._write_cache(cache_path, version, data)
+        return data
+
+    @staticmethod
+    def _cache_path(path: Path) -> Path:
+        """Return the cache file for a data file.
+
+        There is one cache file per data file; the loader format, mtime and size
+        it was built from are stored inside, so a changed file overwrites its
+        stale entry rather than adding another one.
+        """
+        key = str(path.resolve()).encode("utf-8")
+        return CACHE_DIR / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.pkl"
+
+    @staticmethod
+    def _read_cache(cache_path: Path, version: Tuple[int, int, int]) -> Optional[List[Dict[str, Any]]]:
+        """Load cached records, or None if there is no entry for this file version."""
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_version, data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+            return None
+        return data if cached_version == version else None
+
+    @staticmethod
+    def _write_cache(cache_path: Path, version: Tuple[int, int, int], data: List[Dict[str, Any]]) -> None:
+        """Store parsed records with their file version, replacing the cache file atomically."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((version, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write cache file {cache_path}: {e}")
+
     @classmethod
     def load_directory(
         cls,
         directory: Union[str, Path],
         recursive: bool = True,
         pattern: str = "*.*"
-    ) -> Dict[Path, List[Dict[str, Any]]]:
-        """Load all data files from a directory."""
+    ) -> Dict[Path, Iterable[Dict[str, Any]]]:
+        """Load all data files from a directory.
+
+        The pattern is matched against file names and may contain brace
+        groups such as "*.{json,csv,parquet}".
+        """
         dir_path = Path(directory)
         if not dir_path.is_dir():
             raise NotADirectoryError(f"Not a directory: {directory}")
 
         result = {}
-        glob_pattern = "**/" + pattern if recursive else pattern
-
-        for file_path in dir_path.glob(glob_pattern):
-            if file_path.is_file():
-                try:
-                    data = cls.load_file(file_path)
-                    if data:
-                        result[file_path] = data
-                except Exception as e:
-                    logger.warning(f"Skipping file {file_path}: {e}")
-                    continue
+        patterns = _expand_braces(pattern)
+
+        for entry in _iter_files(str(dir_path), recursive):
+            if not any(fnmatch.fnmatchcase(entry.name, p) for p in patterns):
+                continue
+
+            file_path = Path(entry.path)
+            try:
+                data = cls.load_file(file_path)
+                if data:
+                    result[file_path] = data
+            except Exception as e:
+                logger.warning(f"Skipping file {file_path}: {e}")
+                continue
 
         return result
 
@@ -109,17 +257,23 @@ class DataLoader:
     def create_data_items(
         cls,
         source_id: str,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         metadata: Optional[Dict[str, Any]] = None
     ) -> List[DataItem]:
-        """Convert raw data to DataItem objects."""
+        """Convert raw data to DataItem objects.
+
+        The records come straight from the loaders above, so validation is
+        skipped and the models are constructed directly.
+        """
         metadata = metadata or {}
-        return [
-            DataItem(
+        items = []
+        for i, item in enumerate(data):
+            if not isinstance(item, dict):
+                raise ValueError(f"Record {i} of {source_id} is not an object")
+            items.append(DataItem.model_construct(
                 id=f"item_{source_id}_{i}",
                 source_id=source_id,
                 data=item,
-                metadata=metadata
-            )
-            for i, item in enumerate(data)
-        ]
+                metadata=dict(metadata)
+            ))
+        return items
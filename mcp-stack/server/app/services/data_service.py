@@ -1,13 +1,24 @@
 """Service for managing data sources and items."""
 import uuid
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 
+from ..data.search_index import TrigramIndex
 from ..models.data_models import DataItem, DataPage, DataQuery, DataSource, DataSourceType
 from .data_loader import DataLoader
 
+# Largest magnitude up to which every integer is exactly representable as float64
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _sort_key(value: Any, reverse: bool) -> Tuple[bool, Any]:
+    """Sort key that orders None (e.g. an empty CSV cell) last in either direction."""
+    return ((value is None) != reverse, value)
+
 class DataService:
     """Service for managing data sources and items."""
 
@@ -16,6 +27,17 @@ class DataService:
         self.data_dir = Path(data_dir).resolve()
         self.sources: Dict[str, DataSource] = {}
         self.items: Dict[str, DataItem] = {}
+        # Columnar view of item data used to vectorize query filters
+        self._items_df = pd.DataFrame()
+        self._items_present = pd.DataFrame()
+        # Row positions of each source's items, and memoized sort ranks keyed
+        # on (sort_by, reverse); both are rebuilt with the frame
+        self._source_rows: Dict[str, np.ndarray] = {}
+        self._sort_ranks: Dict[Tuple[str, bool], Optional[np.ndarray]] = {}
+        # Trigram index over each item's stringified values for text search,
+        # and those values lowercased per field for verifying candidates
+        self._search_index = TrigramIndex()
+        self._lowered_values: Dict[str, Dict[str, str]] = {}
 
         # Create data directory if it doesn't exist
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -37,6 +59,14 @@ class DataService:
                 source_id = f"src_{file_path.stem}"
                 source_type = DataLoader.detect_source_type(file_path)
 
+                # Create data items; JSON arrays may be streamed, so the item
+                # count is only known afterwards
+                items = DataLoader.create_data_items(
+                    source_id=source_id,
+                    data=data,
+                    metadata={"source_path": str(file_path.relative_to(self.data_dir))}
+                )
+
                 source = DataSource(
                     id=source_id,
                     name=file_path.name,
@@ -44,17 +74,10 @@ class DataService:
                     source_type=source_type,
                     metadata={
                         "file_size": file_path.stat().st_size,
-                        "num_items": len(data)
+                        "num_items": len(items)
                     }
                 )
 
-                # Create data items
-                items = DataLoader.create_data_items(
-                    source_id=source_id,
-                    data=data,
-                    metadata={"source_path": str(file_path.relative_to(self.data_dir))}
-                )
-
                 # Store source and items
                 self.sources[source_id] = source
                 for item in items:
@@ -66,8 +89,116 @@ class DataService:
                 logger.error(f"Error processing file {file_path}: {e}")
                 continue
 
+        self._build_items_frame()
+        self._build_search_index()
         return list(self.sources.values())
 
+    def _build_items_frame(self) -> None:
+        """Rebuild the columnar view of the items used by query_data_items."""
+        item_ids = list(self.items)
+        datas = [item.data for item in self.items.values()]
+
+        self._items_df = pd.DataFrame.from_records(datas, index=item_ids) if datas else pd.DataFrame(index=item_ids)
+        # from_records turns integer columns with gaps into float64, which would
+        # make large ints compare equal to their neighbours; keep those exact
+        for key in self._items_df.columns[self._items_df.dtypes == np.float64]:
+            values = [data.get(key) for data in datas]
+            if any(type(v) is int and abs(v) > _MAX_EXACT_FLOAT_INT for v in values):
+                self._items_df[key] = pd.Series(values, index=self._items_df.index, dtype=object)
+        self._items_df.insert(0, "__source_id__", [item.source_id for item in self.items.values()])
+        # Records missing a key pass any filter on it, so track key presence
+        # separately from None/NaN values
+        self._items_present = pd.DataFrame.from_records(
+            [dict.fromkeys(data, True) for data in datas], index=item_ids
+        ).notna() if datas else pd.DataFrame(index=item_ids)
+
+        self._source_rows = {
+            source_id: np.asarray(rows)
+            for source_id, rows in self._items_df.groupby("__source_id__", sort=False).indices.items()
+        }
+        self._sort_ranks = {}
+
+    def _sort_rank(self, sort_by: str, reverse: bool) -> Optional[np.ndarray]:
+        """Return each row's position when all items are sorted by sort_by.
+
+        Returns None if the values cannot be ordered together, in which case
+        the caller sorts the matched items directly.
+        """
+        cache_key = (sort_by, reverse)
+        if cache_key not in self._sort_ranks:
+            order = self._numeric_sort_order(sort_by, reverse)
+            if order is None:
+                items = list(self.items.values())
+                try:
+                    order = sorted(
+                        range(len(items)),
+                        key=lambda row: _sort_key(items[row].data.get(sort_by, ""), reverse),
+                        reverse=reverse
+                    )
+                except TypeError:
+                    order = None
+
+            rank = None
+            if order is not None:
+                rank = np.empty(len(order), dtype=np.intp)
+                rank[order] = np.arange(len(order))
+            self._sort_ranks[cache_key] = rank
+        return self._sort_ranks[cache_key]
+
+    def _numeric_sort_order(self, sort_by: str, reverse: bool) -> Optional[np.ndarray]:
+        """Sort a fully populated numeric column with np.argsort.
+
+        Returns None when the column is missing, non-numeric, or has gaps,
+        since those need Python's comparison semantics.
+        """
+        if sort_by not in self._items_df.columns or sort_by == "__source_id__":
+            return None
+
+        column = self._items_df[sort_by]
+        if not pd.api.types.is_numeric_dtype(column) or column.isna().any():
+            return None
+        if not self._items_present[sort_by].all():
+            return None
+
+        values = column.to_numpy()
+        if not reverse:
+            return np.argsort(values, kind="stable")
+        # sorted(reverse=True) keeps ties in their original order, which is a
+        # stable ascending sort of the reversed values, read backwards
+        return (len(values) - 1 - np.argsort(values[::-1], kind="stable"))[::-1]
+
+    def _build_search_index(self) -> None:
+        """Rebuild the trigram index used by search_data_items."""
+        self._search_index.clear()
+        self._lowered_values = {}
+        for item_id, item in self.items.items():
+            lowered = {field: str(value).lower() for field, value in item.data.items()}
+            self._lowered_values[item_id] = lowered
+            self._search_index.add(item_id, lowered.values())
+
+    def _filter_rows(self, rows: np.ndarray, key: str, value: Any) -> np.ndarray:
+        """Narrow row positions to the items matching a single equality filter."""
+        if key not in self._items_df.columns or key == "__source_id__":
+            return rows
+
+        column = self._items_df[key].iloc[rows]
+        if value is None:
+            # None and NaN share a representation in numeric columns, so
+            # check the original values
+            matches = np.fromiter(
+                (self.items[item_id].data.get(key) is None for item_id in column.index),
+                dtype=bool,
+                count=len(column)
+            )
+        elif pd.api.types.is_scalar(value):
+            if column.dtype.kind == "f" and type(value) is int and abs(value) > _MAX_EXACT_FLOAT_INT:
+                # Python compares ints and floats exactly; numpy would round value
+                column = column.astype(object)
+            matches = (column == value).to_numpy()
+        else:
+            matches = column.map(lambda v: v == value).to_numpy(dtype=bool)
+        return rows[matches | ~self._items_present[key].to_numpy()[rows]]
+
     async def get_data_source(self, source_id: str) -> Optional[DataSource]:
         """Get a data source by ID."""
         return self.sources.get(source_id)
@@ -83,38 +214,44 @@ class DataService:
     ) -> DataPage[DataItem]:
         """Query data items with optional filtering and pagination."""
         query = query or DataQuery()
-        items = list(self.items.values())
 
         # Filter by source if specified
         if source_id:
-            items = [item for item in items if item.source_id == source_id]
-
-        # Apply filters if specified
-        if query.filters:
-            filtered_items = []
-            for item in items:
-                match = True
-                for key, value in query.filters.items():
-                    if key in item.data and item.data[key] != value:
-                        match = False
-                        break
-                if match:
-                    filtered_items.append(item)
-            items = filtered_items
-
-        # Sort if specified
+            rows = self._source_rows.get(source_id, np.empty(0, dtype=np.intp))
+        else:
+            rows = np.arange(len(self._items_df))
+
+        # Apply filters if specified, each one only over the rows that are
+        # still matching
+        for key, value in (query.filters or {}).items():
+            if not len(rows):
+                break
+            rows = self._filter_rows(rows, key, value)
+
+        # Sort if specified; a stable sort of all items restricted to the
+        # matched rows gives the same order as sorting the matches
+        rank = None
         if query.sort_by:
             reverse = query.sort_order.lower() == "desc"
-            items.sort(
-                key=lambda x: x.data.get(query.sort_by, ""),
-                reverse=reverse
-            )
+            rank = self._sort_rank(query.sort_by, reverse)
+            if rank is not None:
+                rows = rows[np.argsort(rank[rows], kind="stable")]
 
-        # Apply pagination
-        total = len(items)
+        total = len(rows)
         start = query.offset
         end = start + query.limit
-        paginated_items = items[start:end]
+
+        if query.sort_by and rank is None:
+            items = [self.items[item_id] for item_id in self._items_df.index[rows]]
+            items.sort(
+                key=lambda x: _sort_key(x.data.get(query.sort_by, ""), reverse),
+                reverse=reverse
+            )
+            paginated_items = items[start:end]
+        else:
+            # Rows are already in order, so only the requested page of
+            # items is ever materialized
+            paginated_items = [self.items[item_id] for item_id in self._items_df.index[rows[start:end]]]
 
         return DataPage(
             items=paginated_items,
@@ -138,18 +275,22 @@ class DataService:
         results = []
         query = query.lower()
 
-        for item in self.items.values():
+        # The index narrows the scan to items containing every query trigram;
+        # short queries fall back to checking all items
+        candidates = self._search_index.candidates(query)
+        item_ids = self.items.keys() if candidates is None else candidates
+
+        for item_id in item_ids:
+            lowered = self._lowered_values[item_id]
             # If specific fields are provided, only search those
-            search_fields = fields if fields else item.data.keys()
+            search_fields = fields if fields else lowered.keys()
 
             for field in search_fields:
-                if field in item.data:
-                    value = str(item.data[field]).lower()
-                    if query in value:
-                        results.append(item)
-                        break
-
-            if len(results) >= limit:
-                break
+                value = lowered.get(field)
+                if value is not None and query in value:
+                    results.append(self.items[item_id])
+                    if len(results) >= limit:
+                        return results[:limit]
+                    break
 
         return results[:limit]
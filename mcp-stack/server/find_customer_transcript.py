@@ -1,33 +1,181 @@
-import json
 import os
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-def find_latest_transcript(customer_id):
-    transcripts_dir = Path("mcp-sampledata/data/transcripts")
-    customer_transcripts = []
+import orjson
+import pandas as pd
 
+TRANSCRIPTS_DIR = Path("mcp-sampledata/data/transcripts")
+# Kept next to (not inside) the transcripts directory so writing it does not
+# change the directory's mtime
+INDEX_FILENAME = ".transcript_index.pkl"
+# Bumped whenever the pickled index layout changes
+INDEX_VERSION = 3
+PARQUET_FILENAME = "transcripts.parquet"
+
+# Worker count for reading transcript files while building the index; the
+# scan is I/O-bound
+_INDEX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_CUSTOMER_ID_RE = re.compile(rb'"customer_id"\s*:\s*"([^"\\]*)"')
+_CALL_TIMESTAMP_RE = re.compile(rb'"call_timestamp"\s*:\s*"([^"\\]*)"')
+
+def _read_index_fields(raw):
+    """Return (customer_id, call_timestamp) from a transcript file's bytes.
+
+    The fields are pulled out with a byte-level match when each key occurs
+    exactly once, so the file is only fully parsed when that is ambiguous.
+    """
+    if raw.count(b'"customer_id"') == 1 and raw.count(b'"call_timestamp"') == 1:
+        customer_match = _CUSTOMER_ID_RE.search(raw)
+        timestamp_match = _CALL_TIMESTAMP_RE.search(raw)
+        if customer_match and timestamp_match:
+            return customer_match.group(1).decode('utf-8'), timestamp_match.group(1).decode('utf-8')
+
+    data = orjson.loads(raw)
+    return data.get('customer_id'), data['call_timestamp']
+
+def _index_entry(transcript_file):
+    """Return (customer_id, ISO timestamp, file name) for one transcript file."""
+    try:
+        with open(transcript_file, 'rb') as f:
+            customer_id, call_timestamp = _read_index_fields(f.read())
+        # Fixed-width ISO 8601 strings order the same way as the datetimes
+        # they encode, so only the winning timestamp is ever parsed
+        return customer_id, call_timestamp.replace('"', ''), transcript_file.name
+    except Exception as e:
+        print(f"Error processing {transcript_file}: {e}")
+        return None
+
+def _build_index(transcripts_dir):
+    """Map each customer ID to its (ISO timestamp, file name) pairs, newest first."""
+    index = {}
+    with ThreadPoolExecutor(max_workers=_INDEX_WORKERS) as executor:
+        for entry in executor.map(_index_entry, transcripts_dir.glob("*.json")):
+            if entry is not None:
+                customer_id, timestamp, file_name = entry
+                index.setdefault(customer_id, []).append((timestamp, file_name))
+
+    for entries in index.values():
+        entries.sort(reverse=True)
+    return index
+
+def _data_mtime_ns(transcripts_dir):
+    """Return the newest mtime across the transcripts directory and its files.
+
+    Rewriting a transcript in place does not change the directory's mtime, so
+    the files themselves are checked too.
+    """
+    mtime = os.stat(transcripts_dir).st_mtime_ns
+    with os.scandir(transcripts_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json'):
+                try:
+                    mtime = max(mtime, entry.stat().st_mtime_ns)
+                except OSError:
+                    continue
+    return mtime
+
+def _load_index(transcripts_dir, data_mtime=None):
+    """Load the cached transcript index, rebuilding it if any transcript changed."""
+    index_path = transcripts_dir.parent / INDEX_FILENAME
+    if data_mtime is None:
+        data_mtime = _data_mtime_ns(transcripts_dir)
+
+    try:
+        with open(index_path, 'rb') as f:
+            cached = pickle.load(f)
+        if (cached.get('version') == INDEX_VERSION and cached['data_mtime'] == data_mtime
+                and cached['dir'] == str(transcripts_dir.resolve())):
+            return cached['index']
+    except (OSError, EOFError, KeyError, TypeError, AttributeError, pickle.UnpicklingError):
+        pass
+
+    index = _build_index(transcripts_dir)
+    try:
+        with open(index_path, 'wb') as f:
+            pickle.dump({
+                'version': INDEX_VERSION,
+                'dir': str(transcripts_dir.resolve()),
+                'data_mtime': data_mtime,
+                'index': index
+            }, f)
+    except OSError as e:
+        print(f"Could not save transcript index to {index_path}: {e}")
+    return index
+
+def build_transcripts_parquet(transcripts_dir=TRANSCRIPTS_DIR, row_group_size=10000):
+    """Consolidate the transcript JSON files into a single Parquet shard.
+
+    Rows are sorted by customer ID and call timestamp so each row group covers
+    a narrow customer range, letting customer filters skip most of the file.
+    The full record is kept as JSON text because the nested transcript entries
+    do not have a fixed schema.
+
+    Returns:
+        Path to the written Parquet file
+    """
+    rows = []
     for transcript_file in transcripts_dir.glob("*.json"):
         try:
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if data.get('customer_id') == customer_id:
-                    # Convert timestamp to datetime for sorting
-                    timestamp = datetime.fromisoformat(data['call_timestamp'].replace('"', ''))
-                    customer_transcripts.append({
-                        'file': transcript_file.name,
-                        'timestamp': timestamp,
-                        'data': data
-                    })
+            with open(transcript_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw)
+            rows.append({
+                'customer_id': data.get('customer_id'),
+                'call_timestamp': data['call_timestamp'].replace('"', ''),
+                'file': transcript_file.name,
+                'data': raw.decode('utf-8')
+            })
         except Exception as e:
             print(f"Error processing {transcript_file}: {e}")
 
-    if not customer_transcripts:
+    df = pd.DataFrame(rows, columns=['customer_id', 'call_timestamp', 'file', 'data'])
+    df = df.sort_values(['customer_id', 'call_timestamp'], ignore_index=True)
+
+    parquet_path = transcripts_dir.parent / PARQUET_FILENAME
+    df.to_parquet(parquet_path, index=False, compression='zstd', row_group_size=row_group_size)
+    return parquet_path
+
+def _find_latest_in_parquet(parquet_path, customer_id):
+    df = pd.read_parquet(parquet_path, filters=[('customer_id', '=', customer_id)],
+                         columns=['call_timestamp', 'file', 'data'])
+    if df.empty:
+        return None
+
+    row = df.loc[df['call_timestamp'].idxmax()]
+    return {
+        'file': row['file'],
+        'timestamp': datetime.fromisoformat(row['call_timestamp']),
+        'data': orjson.loads(row['data'])
+    }
+
+def find_latest_transcript(customer_id, transcripts_dir=TRANSCRIPTS_DIR):
+    # Prefer the Parquet shard while it is newer than every transcript file
+    data_mtime = _data_mtime_ns(transcripts_dir)
+    parquet_path = transcripts_dir.parent / PARQUET_FILENAME
+    try:
+        if os.stat(parquet_path).st_mtime_ns >= data_mtime:
+            return _find_latest_in_parquet(parquet_path, customer_id)
+    except OSError:
+        pass
+
+    entries = _load_index(transcripts_dir, data_mtime).get(customer_id)
+    if not entries:
         return None
 
-    # Sort by timestamp in descending order (newest first)
-    customer_transcripts.sort(key=lambda x: x['timestamp'], reverse=True)
-    return customer_transcripts[0]
+    # Entries are sorted newest first, so only the winning file is parsed
+    timestamp, file_name = entries[0]
+    with open(transcripts_dir / file_name, 'rb') as f:
+        data = orjson.loads(f.read())
+    return {
+        'file': file_name,
+        'timestamp': datetime.fromisoformat(timestamp),
+        'data': data
+    }
 
 if __name__ == "__main__":
     customer_id = "CUST1000"
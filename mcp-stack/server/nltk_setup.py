@@ -10,6 +10,8 @@ import sys
 import nltk
 import logging
 
+from app.data.nltk_setup import REQUIRED_DATA
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,21 +29,13 @@ def setup_nltk():
         # Set environment variable for NLTK to find the data
         os.environ['NLTK_DATA'] = nltk_data_dir
 
-        # List of NLTK data packages to download
-        nltk_packages = [
-            'punkt',         # For tokenization
-            'stopwords',     # For stop word filtering
-            'wordnet',       # For lemmatization
-            'averaged_perceptron_tagger',  # For part-of-speech tagging
-            'vader_lexicon'  # For sentiment analysis
-        ]
-
         logger.info("Checking NLTK data...")
 
-        # Download each package if not already present
-        for package in nltk_packages:
+        # Download each package if not already present, probing the resource
+        # path it actually installs to so present data is never re-fetched
+        for package, resource in REQUIRED_DATA.items():
             try:
-                nltk.data.find(f'tokenizers/{package}')
+                nltk.data.find(resource)
                 logger.info(f" {package} is already downloaded")
             except LookupError:
                 logger.info(f"Downloading {package}...")
@@ -1,5 +1,32 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Optionally compile the GraphQL resolver modules with Cython. The plain .py
+# sources are still used when the extensions are not built (e.g. in dev).
+# app/ is a namespace package (no __init__.py), so the dotted module names are
+# given explicitly; cythonize would otherwise name them graphql.schema etc.
+CYTHON_MODULES = {
+    "app.graphql.schema": "app/graphql/schema.py",
+    "app.graphql.data_types": "app/graphql/data_types.py",
+}
+
+def get_ext_modules():
+    """Return Cython extensions when MCP_CYTHONIZE=1, otherwise nothing."""
+    if os.getenv("MCP_CYTHONIZE") != "1":
+        return []
+
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("MCP_CYTHONIZE is set but Cython is not installed; building pure Python")
+        return []
+
+    from setuptools import Extension
+
+    extensions = [Extension(name, [source]) for name, source in CYTHON_MODULES.items()]
+    return cythonize(extensions, language_level=3, quiet=True)
+
 def download_nltk_data():
     """Download required NLTK data."""
     import nltk
@@ -29,6 +56,7 @@ setup(
     name="mcp-server",
     version="0.1.0",
     packages=find_packages(),
+    ext_modules=get_ext_modules(),
     install_requires=requirements,
     python_requires='>=3.8',
     # This will run the download_nltk_data function after installation
@@ -8,10 +8,15 @@ def test_get_customers_with_transcripts():
         print("No customers with transcripts found")
         return
 
+    # Fetch every customer's transcripts from the per-customer index at once
+    transcripts_by_customer = data_loader.get_transcripts_for_customers(
+        [customer.customer_id for customer in customers]
+    )
+
     print(f"Found {len(customers)} customers with transcripts:")
     for customer in customers:
         # Get the customer's transcripts
-        transcripts = data_loader.search_transcripts(customer_id=customer.customer_id)
+        transcripts = transcripts_by_customer[customer.customer_id]
 
         print(f"\nCustomer: {customer.personal_info.get('first_name', '')} {customer.personal_info.get('last_name', '')}")
         print(f"Email: {customer.personal_info.get('email', 'N/A')}")
@@ -19,9 +24,9 @@ def test_get_customers_with_transcripts():
 
         # Show first 3 transcripts
         for transcript in transcripts[:3]:
-            print(f"  - {getattr(transcript, 'call_type', 'Call')} on {getattr(transcript, 'call_timestamp', 'N/A')}")
-            summary = getattr(transcript, 'call_summary', 'No summary available')
-            print(f"    Summary: {str(summary)[:100]}{'...' if len(str(summary)) > 100 else ''}")
+            print(f"  - {transcript.call_type or 'Call'} on {transcript.call_timestamp or 'N/A'}")
+            summary = transcript.call_summary or 'No summary available'
+            print(f"    Summary: {summary[:100]}{'...' if len(summary) > 100 else ''}")
 
         if len(transcripts) > 3:
             print(f"  - ... and {len(transcripts) - 3} more")
@@ -54,10 +54,9 @@ def test_with_actual_data():
             break
 
 if __name__ == "__main__":
-    # Install NLTK data
-    import nltk
-    nltk.download('punkt')
-    nltk.download('stopwords')
+    # Download NLTK data only if it is missing
+    from nltk_setup import setup_nltk
+    setup_nltk()
 
     test_transcript_analysis()
     test_with_actual_data()
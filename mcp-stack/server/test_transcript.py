@@ -17,7 +17,7 @@ setup_nltk()
 # Now import the modules that use NLTK
 from app.data.data_loader import CallTranscript, DataLoader, analyze_sentiment, extract_contexts
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_transcript_data() -> Dict[str, Any]:
     """Fixture providing sample transcript data for testing."""
     return {
@@ -47,9 +47,14 @@ def sample_transcript_data() -> Dict[str, Any]:
         ]
     }
 
-def test_transcript_creation(sample_transcript_data):
+@pytest.fixture(scope="module")
+def sample_transcript(sample_transcript_data) -> CallTranscript:
+    """Fixture providing a CallTranscript built once from the sample data."""
+    return CallTranscript(**sample_transcript_data)
+
+def test_transcript_creation(sample_transcript):
     """Test creation of CallTranscript with sentiment and contexts."""
-    transcript = CallTranscript(**sample_transcript_data)
+    transcript = sample_transcript
 
     # Test basic fields
     assert transcript.call_id == "TEST123"
@@ -74,9 +79,9 @@ def test_transcript_creation(sample_transcript_data):
     assert isinstance(transcript.contexts, list)
     assert len(transcript.contexts) > 0
 
-def test_transcript_entry_sentiment(sample_transcript_data):
+def test_transcript_entry_sentiment(sample_transcript):
     """Test transcript entry structure."""
-    transcript = CallTranscript(**sample_transcript_data)
+    transcript = sample_transcript
 
     # Test customer entry structure
     customer_entry = transcript.transcript[0]
@@ -91,9 +96,9 @@ def test_transcript_entry_sentiment(sample_transcript_data):
     assert hasattr(agent_entry, 'timestamp')
 
 
-def test_transcript_entry_structure(sample_transcript_data):
+def test_transcript_entry_structure(sample_transcript):
     """Test transcript entry structure."""
-    transcript = CallTranscript(**sample_transcript_data)
+    transcript = sample_transcript
 
     # Test customer entry
     customer_entry = transcript.transcript[0]
@@ -195,19 +200,7 @@ def test_with_actual_data():
             break
 
 if __name__ == "__main__":
-    # Install NLTK data
-    import nltk
-    try:
-        nltk.data.find('tokenizers/punkt')
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        print("Downloading NLTK data...")
-        nltk.download('punkt')
-        nltk.download('stopwords')
-        nltk.download('wordnet')
-        nltk.download('averaged_perceptron_tagger')
-        nltk.download('vader_lexicon')
-
+    # NLTK data was already checked by setup_nltk() on import
     # Run tests using pytest
     import pytest
     pytest.main([__file__, "-v"])
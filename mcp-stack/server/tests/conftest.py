@@ -5,6 +5,7 @@ from typing import Generator, AsyncGenerator
 
 import aiohttp
 import pytest
+import pytest_asyncio
 
 
 @pytest.fixture(scope="session")
@@ -15,7 +16,7 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
-@pytest.fixture(scope="session")
+@pytest_asyncio.fixture(scope="session")
 async def http_client() -> AsyncGenerator[aiohttp.ClientSession, None]:
     """Create and yield an aiohttp ClientSession for making HTTP requests."""
     async with aiohttp.ClientSession() as session:
@@ -1,8 +1,11 @@
 """Test cases for the MCP Server API."""
 import os
 import pytest
+import pytest_asyncio
 import aiohttp
 import asyncio
+import orjson
+from datetime import datetime
 from typing import Dict, Any
 
 # Base URL for the API
@@ -13,8 +16,12 @@ GRAPHQL_ENDPOINT = f"{BASE_URL}/graphql"
 TEST_CUSTOMER_ID = "CUST1000"
 TEST_CALL_ID = "CALL1000"
 
-async def make_graphql_query(query: str, variables: Dict[str, Any] = None) -> Dict[str, Any]:
-    """Helper function to make GraphQL queries."""
+async def make_graphql_query(
+    session: aiohttp.ClientSession,
+    query: str,
+    variables: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """Helper function to make GraphQL queries over a shared client session."""
     headers = {"Content-Type": "application/json"}
     payload = {"query": query}
     if variables:
@@ -26,22 +33,73 @@ async def make_graphql_query(query: str, variables: Dict[str, Any] = None) -> Di
         print(f"Variables: {variables}")
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(GRAPHQL_ENDPOINT, json=payload, headers=headers) as response:
-                response_data = await response.json()
-                print(f"Response status: {response.status}")
-                print(f"Response data: {response_data}")
+        # orjson handles both directions; it is much faster than the stdlib
+        # json that aiohttp uses for json= and response.json()
+        async with session.post(GRAPHQL_ENDPOINT, data=orjson.dumps(payload), headers=headers) as response:
+            response_data = orjson.loads(await response.read())
+            print(f"Response status: {response.status}")
+            print(f"Response data: {response_data}")
 
-                if "errors" in response_data:
-                    print(f"GraphQL Errors: {response_data['errors']}")
+            if "errors" in response_data:
+                print(f"GraphQL Errors: {response_data['errors']}")
 
-                return response_data
+            return response_data
     except Exception as e:
         print(f"Error making GraphQL request: {str(e)}")
         raise
 
-@pytest.mark.asyncio
-async def test_health_check():
+# Every field under test, fetched in a single request; each test asserts on
+# its own part of the response
+ALL_FIELDS_QUERY = """
+query AllFields($customerId: String!, $callId: String!, $filter: CustomerFilterInput!) {
+    health {
+        status
+        timestamp
+        version
+    }
+    listTools {
+        id
+        name
+        description
+        category
+        isAvailable
+    }
+    getCustomer(customerId: $customerId) {
+        customerId
+        firstName
+        lastName
+        email
+    }
+    getTranscript(callId: $callId) {
+        callId
+        customerId
+        callTimestamp
+        callDurationSeconds
+        callSummary
+    }
+    searchCustomers(filter: $filter) {
+        customerId
+        firstName
+        lastName
+        state
+    }
+}
+"""
+
+@pytest_asyncio.fixture(scope="session")
+async def all_responses(http_client: aiohttp.ClientSession) -> Dict[str, Any]:
+    """Run the combined query once and share the response across tests."""
+    variables = {
+        "customerId": TEST_CUSTOMER_ID,
+        "callId": TEST_CALL_ID,
+        "filter": {
+            "state": "CA",
+            "limit": 3
+        }
+    }
+    return await make_graphql_query(http_client, ALL_FIELDS_QUERY, variables)
+
+def test_health_check(all_responses):
     """
     Test the health check endpoint.
 
@@ -50,19 +108,7 @@ async def test_health_check():
     2. Returns a valid response with expected fields
     3. Status is 'ok' when service is healthy
     """
-    # Define the GraphQL query
-    query = """
-    query HealthCheck {
-        health {
-            status
-            timestamp
-            version
-        }
-    }
-    """
-
-    # Make the request
-    response = await make_graphql_query(query)
+    response = all_responses
 
     # Basic response validation
     assert "data" in response, "Response should contain 'data' field"
@@ -91,42 +137,16 @@ async def test_health_check():
     assert re.match(version_pattern, health_data["version"]), \
         f"Version should be in semver format (e.g., 1.0.0), got {health_data['version']}"
 
-@pytest.mark.asyncio
-async def test_list_tools():
+def test_list_tools(all_responses):
     """Test listing available tools."""
-    query = """
-    query {
-        listTools {
-            id
-            name
-            description
-            category
-            isAvailable
-        }
-    }
-    """
-
-    response = await make_graphql_query(query)
+    response = all_responses
     assert "data" in response, "Response should contain 'data' field"
     assert "listTools" in response["data"], "Response should contain 'listTools' field"
     assert isinstance(response["data"]["listTools"], list), "Tools should be a list"
 
-@pytest.mark.asyncio
-async def test_get_customer():
+def test_get_customer(all_responses):
     """Test retrieving a customer by ID."""
-    query = """
-    query GetCustomer($customerId: String!) {
-        getCustomer(customerId: $customerId) {
-            customerId
-            firstName
-            lastName
-            email
-        }
-    }
-    """
-
-    variables = {"customerId": TEST_CUSTOMER_ID}
-    response = await make_graphql_query(query, variables)
+    response = all_responses
 
     assert "data" in response, "Response should contain 'data' field"
     assert "getCustomer" in response["data"], "Response should contain 'getCustomer' field"
@@ -134,23 +154,9 @@ async def test_get_customer():
     assert customer is not None, f"Customer with ID {TEST_CUSTOMER_ID} should exist"
     assert customer["customerId"] == TEST_CUSTOMER_ID, "Customer ID should match"
 
-@pytest.mark.asyncio
-async def test_get_transcript():
+def test_get_transcript(all_responses):
     """Test retrieving a call transcript by ID."""
-    query = """
-    query GetTranscript($callId: String!) {
-        getTranscript(callId: $callId) {
-            callId
-            customerId
-            callTimestamp
-            callDurationSeconds
-            callSummary
-        }
-    }
-    """
-
-    variables = {"callId": TEST_CALL_ID}
-    response = await make_graphql_query(query, variables)
+    response = all_responses
 
     assert "data" in response, "Response should contain 'data' field"
     assert "getTranscript" in response["data"], "Response should contain 'getTranscript' field"
@@ -159,28 +165,9 @@ async def test_get_transcript():
     assert transcript["callId"] == TEST_CALL_ID, "Call ID should match"
     assert int(transcript["callDurationSeconds"]) > 0, "Call duration should be positive"
 
-@pytest.mark.asyncio
-async def test_search_customers():
+def test_search_customers(all_responses):
     """Test searching for customers."""
-    query = """
-    query SearchCustomers($filter: CustomerFilterInput!) {
-        searchCustomers(filter: $filter) {
-            customerId
-            firstName
-            lastName
-            state
-        }
-    }
-    """
-
-    variables = {
-        "filter": {
-            "state": "CA",
-            "limit": 3
-        }
-    }
-
-    response = await make_graphql_query(query, variables)
+    response = all_responses
 
     assert "data" in response, "Response should contain 'data' field"
     assert "searchCustomers" in response["data"], "Response should contain 'searchCustomers' field"
@@ -0,0 +1,115 @@
+"""Tests for DataService queries over loaded data files."""
+import pytest
+
+from app.models.data_models import DataItem, DataQuery
+from app.services import data_loader as services_data_loader
+from app.services.data_service import DataService
+
+
+def make_service(tmp_path, monkeypatch, files):
+    """Write files into a fresh data directory and return a DataService over it."""
+    monkeypatch.setattr(services_data_loader, "CACHE_DIR", tmp_path / "cache")
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name, content in files.items():
+        (data_dir / name).write_text(content)
+    return DataService(data_dir)
+
+
+CITIES_CSV = "name,city,pop\na,LA,3\nb,LA,\nc,LA,1\nd,SF,2\ne,LA,\n"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("files", [
+    {"cities.csv": CITIES_CSV},
+    # A text value in another file makes the column unsortable as a whole,
+    # so the matched rows are sorted on their own
+    {"cities.csv": CITIES_CSV, "other.csv": "name,city,pop\nx,NY,many\n"},
+], ids=["ranked", "fallback"])
+async def test_sort_csv_column_with_empty_cells(tmp_path, monkeypatch, files):
+    """Empty CSV cells load as None and sort last in either direction."""
+    service = make_service(tmp_path, monkeypatch, files)
+    await service.discover_data_sources()
+
+    expected = {"asc": ["c", "a", "b", "e"], "desc": ["a", "c", "b", "e"]}
+    for sort_order, names in expected.items():
+        page = await service.query_data_items(
+            DataQuery(filters={"city": "LA"}, sort_by="pop", sort_order=sort_order)
+        )
+        assert [item.data["name"] for item in page.items] == names
+
+
+BIG = 2 ** 60
+
+# (id, source_id, data); keys are deliberately missing from some records, and
+# "n" mixes ints, floats, bools, None and NaN
+QUERY_ITEMS = [
+    ("i0", "s1", {"n": 1, "g": BIG + 1, "m": 3}),
+    ("i1", "s1", {"n": None, "g": BIG, "m": 1.5}),
+    ("i2", "s2", {"n": 1.0, "m": None}),
+    ("i3", "s2", {"n": True, "g": BIG + 2, "m": 2}),
+    ("i4", "s1", {"n": float("nan"), "g": BIG + 1, "m": True}),
+    ("i5", "s2", {"g": None, "m": 0}),
+]
+
+
+@pytest.fixture
+def query_service(tmp_path):
+    """A DataService holding QUERY_ITEMS."""
+    service = DataService(tmp_path)
+    for item_id, source_id, data in QUERY_ITEMS:
+        service.items[item_id] = DataItem(id=item_id, source_id=source_id, data=data)
+    service._build_items_frame()
+    service._build_search_index()
+    return service
+
+
+async def query_ids(service, source_id=None, **query):
+    page = await service.query_data_items(DataQuery(**query), source_id)
+    return [item.id for item in page.items]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filters, expected", [
+    # A record without the key passes any filter on it; values compare with ==
+    ({"n": 1}, ["i0", "i2", "i3", "i5"]),
+    ({"n": None}, ["i1", "i5"]),
+    # NaN never equals itself, so only records without the key match
+    ({"n": float("nan")}, ["i5"]),
+    # Ints beyond 2**53 must not round onto their neighbours
+    ({"g": BIG + 1}, ["i0", "i2", "i4"]),
+    ({"g": BIG}, ["i1", "i2"]),
+    ({"g": None}, ["i2", "i5"]),
+    ({"n": 1, "g": BIG + 1}, ["i0", "i2"]),
+])
+async def test_query_filters(query_service, filters, expected):
+    """Equality filters follow Python == semantics per record."""
+    assert await query_ids(query_service, filters=filters) == expected
+
+
+@pytest.mark.asyncio
+async def test_query_filters_within_source(query_service):
+    assert await query_ids(query_service, "s2", filters={"n": 1}) == ["i2", "i3", "i5"]
+
+
+@pytest.mark.asyncio
+async def test_query_sort_mixed_numeric_types(query_service):
+    """Ints, floats and bools sort together, with None last either way."""
+    assert await query_ids(query_service, sort_by="m") == ["i5", "i4", "i1", "i3", "i0", "i2"]
+    assert await query_ids(query_service, sort_by="m", sort_order="desc") == [
+        "i0", "i3", "i1", "i4", "i5", "i2"
+    ]
+    assert await query_ids(query_service, sort_by="m", limit=2, offset=1) == ["i4", "i1"]
+
+
+@pytest.mark.asyncio
+async def test_query_sort_large_ints(query_service):
+    """Large ints keep their exact order; equal values keep load order."""
+    assert await query_ids(query_service, "s1", sort_by="g") == ["i1", "i0", "i4"]
+
+
+@pytest.mark.asyncio
+async def test_query_sort_incomparable_values_raises(query_service):
+    """A missing key sorts as "", which cannot be ordered against ints."""
+    with pytest.raises(TypeError):
+        await query_ids(query_service, sort_by="g")
@@ -0,0 +1,111 @@
+"""Tests for automatic persisted queries (APQ) on the GraphQL endpoint."""
+import pytest
+import strawberry
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from strawberry.schema.config import StrawberryConfig
+
+from app.graphql.persisted import PersistedQueryRouter, query_hash
+from app.graphql.schema import Query, get_context
+from app.main import app
+
+
+def apq(sha256_hash):
+    """Return the request extensions that reference a persisted query."""
+    return {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}}
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_unknown_hash_is_not_found(client):
+    """A hash miss asks the client to resend the query text, with HTTP 200."""
+    response = client.post("/graphql", json={"extensions": apq(query_hash("{ unknown }"))})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["data"] is None
+    assert body["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert body["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_query_with_hash_registers_it(client):
+    """Sending the query with its hash stores it for hash-only requests."""
+    query = "{ registered: health { status } }"
+    sha256_hash = query_hash(query)
+
+    response = client.post("/graphql", json={"query": query, "extensions": apq(sha256_hash)})
+    assert response.json() == {"data": {"registered": {"status": "ok"}}}
+
+    response = client.post("/graphql", json={"extensions": apq(sha256_hash)})
+    assert response.status_code == 200
+    assert response.json() == {"data": {"registered": {"status": "ok"}}}
+
+
+def test_hash_mismatch_is_rejected(client):
+    """A hash that does not match the query text is a bad request."""
+    response = client.post("/graphql", json={
+        "query": "{ mismatched: health { status } }",
+        "extensions": apq(query_hash("{ health { status } }")),
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["data"] is None
+    assert body["errors"][0]["message"] == "provided sha does not match query"
+    assert body["errors"][0]["extensions"]["code"] == "BAD_REQUEST"
+
+
+def test_persist_endpoint(client):
+    """POST /graphql/persist returns the hash of a valid query."""
+    query = "{ persisted: health { status } }"
+
+    response = client.post("/graphql/persist", json={"query": query})
+    assert response.status_code == 200
+    assert response.json() == {"sha256Hash": query_hash(query)}
+
+    response = client.post("/graphql", json={"extensions": apq(query_hash(query))})
+    assert response.json() == {"data": {"persisted": {"status": "ok"}}}
+
+
+@pytest.mark.parametrize("query", ["{ health {", "{ noSuchField }"], ids=["syntax", "validation"])
+def test_persist_endpoint_rejects_invalid_query(client, query):
+    """Queries that do not parse or validate are not persisted."""
+    response = client.post("/graphql/persist", json={"query": query})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]
+
+    response = client.post("/graphql", json={"extensions": apq(query_hash(query))})
+    assert response.json()["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_batched_request():
+    """Each operation in a batch resolves its persisted query on its own."""
+    # The app's schema does not enable batching, so mount the router over a
+    # schema that does
+    batching_app = FastAPI()
+    batching_schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(batching_config={"max_operations": 10})
+    )
+    batching_app.include_router(
+        PersistedQueryRouter(batching_schema, context_getter=get_context), prefix="/graphql"
+    )
+    client = TestClient(batching_app)
+
+    query = "{ batched: health { status } }"
+    response = client.post("/graphql", json=[
+        {"query": query, "extensions": apq(query_hash(query))},
+        {"extensions": apq(query_hash(query))},
+        {"extensions": apq(query_hash("{ neverSent }"))},
+        {"query": query, "extensions": apq(query_hash("{ health { status } }"))},
+    ])
+
+    assert response.status_code == 200
+    results = response.json()
+    assert results[0] == {"data": {"batched": {"status": "ok"}}}
+    assert results[1] == {"data": {"batched": {"status": "ok"}}}
+    assert results[2]["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+    assert results[3]["errors"][0]["extensions"]["code"] == "BAD_REQUEST"
@@ -0,0 +1,110 @@
+"""Tests for the in-memory trigram index."""
+import pytest
+
+from app.data.search_index import MIN_QUERY_LENGTH, TrigramIndex
+
+DOCS = {
+    "a": ["Billing question about an overcharge"],
+    "b": ["Refund processed", "billing BILLING billing"],
+    "c": ["Café au lait", "naïve résumé"],
+    "d": ["日本語のテキスト", "東京で会議"],
+    "e": ["aaaaaa"],
+    "f": [],
+}
+
+
+def build_index(docs):
+    index = TrigramIndex()
+    for key, texts in docs.items():
+        index.add(key, texts)
+    return index
+
+
+def brute_force(docs, needle):
+    """Keys whose texts contain needle, in insertion order."""
+    needle = needle.lower()
+    return [key for key, texts in docs.items() if any(needle in text.lower() for text in texts)]
+
+
+def verified(index, docs, needle):
+    """Candidates narrowed down with the substring check callers apply."""
+    candidates = index.candidates(needle)
+    assert set(brute_force(docs, needle)) <= set(candidates)
+    return [key for key in candidates if key in brute_force(docs, needle)]
+
+
+@pytest.mark.parametrize("needle", [
+    "billing", "BILLING", "ing", "question about",  # present, in any case
+    "refund billing", "zzz", "overcharged",  # missing
+    "aaa", "aaaa", "aaaaaaa",  # repeated trigrams
+    "café", "CAFÉ", "ïve", "résumé", "日本語", "本語の", "京で会",  # multi-byte
+])
+def test_candidates_match_brute_force(needle):
+    """The index finds exactly the documents a linear scan finds."""
+    index = build_index(DOCS)
+    assert verified(index, DOCS, needle) == brute_force(DOCS, needle)
+
+
+@pytest.mark.parametrize("needle", ["", "b", "bi", "日本"])
+def test_short_query_is_not_indexed(needle):
+    """Queries shorter than MIN_QUERY_LENGTH characters fall back to a scan."""
+    assert len(needle) < MIN_QUERY_LENGTH
+    assert build_index(DOCS).candidates(needle) is None
+
+
+def test_candidates_follow_insertion_order():
+    docs = {key: ["shared text"] for key in ("z", 3, "m", ("t", 1))}
+    index = build_index(docs)
+
+    assert index.candidates("shared") == ["z", 3, "m", ("t", 1)]
+
+
+def test_readd_replaces_texts_and_keeps_position():
+    index = build_index({"x": ["alpha"], "y": ["alpha"]})
+    index.add("x", ["beta"])
+
+    assert index.candidates("alpha") == ["y"]
+    assert index.candidates("beta") == ["x"]
+
+    index.add("x", ["alpha"])
+    assert index.candidates("alpha") == ["x", "y"]
+
+
+def test_remove():
+    index = build_index({"x": ["alpha"], "y": ["alpha beta"], "z": ["alpha"]})
+    index.remove("y")
+    index.remove("missing")
+
+    assert "y" not in index
+    assert len(index) == 2
+    assert index.candidates("alpha") == ["x", "z"]
+    assert index.candidates("beta") == []
+
+    # A removed key goes to the back when it is added again
+    index.add("y", ["alpha"])
+    assert index.candidates("alpha") == ["x", "z", "y"]
+
+
+def test_remove_keep_position():
+    index = build_index({"x": ["alpha"], "y": ["alpha"], "z": ["alpha"]})
+    index.remove("x", keep_position=True)
+
+    assert "x" not in index
+    assert index.candidates("alpha") == ["y", "z"]
+
+    # A key removed with keep_position returns to its original place
+    index.add("x", ["alpha"])
+    assert index.candidates("alpha") == ["x", "y", "z"]
+
+
+def test_clear():
+    index = build_index(DOCS)
+    index.clear()
+
+    assert len(index) == 0
+    assert "a" not in index
+    assert index.candidates("billing") == []
+
+    index.add("b", ["billing"])
+    index.add("a", ["billing"])
+    assert index.candidates("billing") == ["b", "a"]
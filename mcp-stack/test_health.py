@@ -2,28 +2,30 @@
 import json
 import requests
 
+# GraphQL query
+HEALTH_QUERY = '''
+query {
+    health {
+        status
+        timestamp
+        version
+    }
+}
+'''
+
+# The request body never changes, so it is serialized once
+_HEALTH_BODY = json.dumps({'query': HEALTH_QUERY}).encode('utf-8')
+
+# Shared session so repeated probes reuse the keep-alive connection
+_session = requests.Session()
+_session.headers['Content-Type'] = 'application/json'
+
 def test_health_check():
     """Test the GraphQL health check endpoint."""
     url = 'http://localhost:8005/graphql'
-    headers = {'Content-Type': 'application/json'}
-
-    # GraphQL query
-    query = '''
-    query {
-        health {
-            status
-            timestamp
-            version
-        }
-    }
-    '''
 
     # Send the request
-    response = requests.post(
-        url,
-        json={'query': query},
-        headers=headers
-    )
+    response = _session.post(url, data=_HEALTH_BODY)
 
     # Print the response
     print("Status Code:", response.status_code)